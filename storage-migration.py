@@ -24,13 +24,25 @@ Example:
 """
 
 import argparse
+import functools
 import json
+import os
+import shutil
 import subprocess
 import sys
 import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+try:
+    import yaml
+    _YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+except ImportError:
+    yaml = None
+
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -45,89 +57,302 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+def _disable_colors():
+    for attr in dir(Colors):
+        if not attr.startswith('_'):
+            setattr(Colors, attr, '')
+
+
+# Keep escape sequences out of piped output and CI logs; NO_COLOR follows
+# the convention from no-color.org. --no-color still forces this off too.
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    _disable_colors()
+
+
+# Resolved once at import; 'oc' preferred, 'kubectl' fallback. Probing both
+# names on every subprocess call paid a failed execvp per call on
+# kubectl-only systems.
+KUBECTL_BIN = shutil.which('oc') or shutil.which('kubectl')
+
+# List pagination: 0 asks the server for one unpaginated response, which
+# benchmarks consistently faster than the default chunk size of 100.
+# Override via VMTREE_CHUNK_SIZE if a loaded API server needs paging.
+_CHUNK_SIZE_ARG = f"--chunk-size={os.environ.get('VMTREE_CHUNK_SIZE', '0')}"
+
+
 def run_kubectl(args: List[str], check=True) -> Dict[str, Any]:
     """Run kubectl/oc command and return parsed JSON output"""
-    for cmd in ['oc', 'kubectl']:
+    try:
+        result = subprocess.run(
+            [KUBECTL_BIN] + args + ['-o', 'json'],
+            capture_output=True,
+            text=True,
+            check=check
+        )
+        if result.returncode != 0:
+            return None
+        return json.loads(result.stdout) if result.stdout else None
+    except subprocess.CalledProcessError:
+        return None
+    except json.JSONDecodeError:
+        return None
+
+
+# API coordinates for the custom resources this tool touches
+_KUBEVIRT_GROUP = 'kubevirt.io'
+_KUBEVIRT_VERSION = 'v1'
+_CDI_GROUP = 'cdi.kubevirt.io'
+_CDI_VERSION = 'v1beta1'
+
+# Set by --use-kubectl to skip the python client even when installed
+_CLIENT_DISABLED = False
+
+_K8S_API = None
+
+
+def _get_k8s_api():
+    """Return a CustomObjectsApi from the kubernetes python client, or False.
+
+    The client keeps one HTTPS connection alive across calls, where each
+    kubectl fork re-reads kubeconfig and redoes the TLS handshake. Probed
+    once; False when the package is missing, kubeconfig fails to load, or
+    --use-kubectl was given.
+    """
+    global _K8S_API
+    if _K8S_API is None:
+        if _CLIENT_DISABLED:
+            _K8S_API = False
+        else:
+            try:
+                from kubernetes import client, config
+                config.load_kube_config()
+                _K8S_API = client.CustomObjectsApi()
+            except Exception:
+                _K8S_API = False
+    return _K8S_API
+
+
+def _load_snapshot_via_client(namespace: Optional[str] = None,
+                              dv_selector: Optional[str] = None) -> Optional[tuple]:
+    """Fetch (vms, dvs) through the kubernetes python client, or None"""
+    api = _get_k8s_api()
+    if not api:
+        return None
+
+    selector = dv_selector or ''
+    try:
+        if namespace:
+            vms = api.list_namespaced_custom_object(
+                _KUBEVIRT_GROUP, _KUBEVIRT_VERSION, namespace, 'virtualmachines'
+            ).get('items', [])
+            dvs = api.list_namespaced_custom_object(
+                _CDI_GROUP, _CDI_VERSION, namespace, 'datavolumes',
+                label_selector=selector
+            ).get('items', [])
+        else:
+            vms = api.list_cluster_custom_object(
+                _KUBEVIRT_GROUP, _KUBEVIRT_VERSION, 'virtualmachines'
+            ).get('items', [])
+            dvs = api.list_cluster_custom_object(
+                _CDI_GROUP, _CDI_VERSION, 'datavolumes',
+                label_selector=selector
+            ).get('items', [])
+    except Exception:
+        return None
+    return vms, dvs
+
+
+_IJSON = None
+
+
+def _ijson():
+    """Return the ijson module if installed, else False (memoized)"""
+    global _IJSON
+    if _IJSON is None:
         try:
-            result = subprocess.run(
-                [cmd] + args + ['-o', 'json'],
-                capture_output=True,
-                text=True,
-                check=check
-            )
-            if result.returncode != 0:
-                return None
-            return json.loads(result.stdout) if result.stdout else None
-        except FileNotFoundError:
+            import ijson
+            _IJSON = ijson
+        except ImportError:
+            _IJSON = False
+    return _IJSON
+
+
+def run_kubectl_stream(args: List[str]):
+    """Yield items from a kubectl list response one resource at a time.
+
+    When ijson is installed the response is parsed incrementally off the
+    subprocess pipe, so consumers start filtering before kubectl finishes
+    writing and the full items array is never materialized twice. Without
+    ijson this falls back to run_kubectl and yields from the parsed list.
+    """
+    ij = _ijson()
+    if not ij:
+        result = run_kubectl(args, check=False)
+        yield from (result.get('items', []) if result else [])
+        return
+
+    proc = subprocess.Popen(
+        [KUBECTL_BIN] + args + ['-o', 'json'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        yield from ij.items(proc.stdout, 'items.item', use_float=True)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+def run_kubectl_raw(args: List[str]) -> Optional[str]:
+    """Run kubectl/oc command and return raw stdout (no JSON parsing)"""
+    result = subprocess.run(
+        [KUBECTL_BIN] + args,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+# Project only the DV fields the migration needs: namespace, name, owning VM
+# UIDs, storage class, requested size, access modes. Tab-separated fields,
+# space-separated sublists. Cuts the response to a few hundred bytes per DV
+# vs. full -o json.
+_DV_JSONPATH = (
+    '-o=jsonpath={range .items[*]}'
+    '{.metadata.namespace}{"\\t"}{.metadata.name}{"\\t"}'
+    '{.metadata.ownerReferences[?(@.kind==\'VirtualMachine\')].uid}{"\\t"}'
+    '{.spec.storage.storageClassName}{"\\t"}'
+    '{.spec.storage.resources.requests.storage}{"\\t"}'
+    '{.spec.storage.accessModes[*]}{"\\n"}{end}'
+)
+
+
+def get_datavolumes_slim(namespace: Optional[str] = None,
+                         selector: Optional[str] = None) -> Optional[List[Dict]]:
+    """Get DataVolumes with only migration-relevant fields, as DV-shaped dicts.
+
+    An optional label selector is pushed to the API server so only
+    matching DVs are serialized and returned. Returns None if the
+    jsonpath query fails, so callers can fall back to a full -o json list.
+    """
+    cmd = ['get', 'dv']
+    if namespace:
+        cmd.extend(['-n', namespace])
+    else:
+        cmd.append('--all-namespaces')
+    if selector:
+        cmd.extend(['-l', selector])
+    cmd.append(_CHUNK_SIZE_ARG)
+    cmd.append(_DV_JSONPATH)
+
+    output = run_kubectl_raw(cmd)
+    if output is None:
+        return None
+
+    dvs = []
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 6:
             continue
-        except subprocess.CalledProcessError:
-            return None
-        except json.JSONDecodeError:
-            return None
-    return None
+        ns, name, owner_uids, sc, size, access_modes = fields
+        dvs.append({
+            'kind': 'DataVolume',
+            'metadata': {
+                'name': name,
+                'namespace': ns,
+                'ownerReferences': [
+                    {'kind': 'VirtualMachine', 'uid': uid}
+                    for uid in owner_uids.split()
+                ],
+            },
+            'spec': {
+                'storage': {
+                    'storageClassName': sc or None,
+                    'accessModes': access_modes.split() or ['ReadWriteOnce'],
+                    'resources': {'requests': {'storage': size or '0Gi'}},
+                },
+            },
+        })
+    return dvs
+
+
+def _emit(msg: str, out: Optional[List[str]] = None) -> None:
+    """Append msg to a worker's line buffer, or print when none is given.
+
+    The migration helpers run on worker threads whose output is collected
+    and emitted per-VM; printing from inside them would interleave error
+    lines from different VMs, so callers pass their buffer down instead.
+    """
+    if out is None:
+        print(msg)
+    else:
+        out.append(msg)
 
 
-def run_kubectl_apply(yaml_content: str, dry_run: bool = False) -> bool:
+def run_kubectl_apply(yaml_content: str, dry_run: bool = False,
+                      out: Optional[List[str]] = None) -> bool:
     """Apply YAML content using kubectl"""
-    for cmd in ['oc', 'kubectl']:
-        try:
-            args = [cmd, 'apply', '-f', '-']
-            if dry_run:
-                args.append('--dry-run=client')
-
-            result = subprocess.run(
-                args,
-                input=yaml_content,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except FileNotFoundError:
-            continue
-        except subprocess.CalledProcessError as e:
-            print(f"{Colors.FAIL}Error applying YAML: {e.stderr}{Colors.ENDC}")
-            return False
-    return False
+    args = [KUBECTL_BIN, 'apply', '-f', '-']
+    if dry_run:
+        args.append('--dry-run=client')
+
+    # Success chatter ("datavolume.cdi.kubevirt.io/... created") goes to
+    # /dev/null rather than being buffered into Python strings; stderr is
+    # only decoded when the apply actually fails
+    result = subprocess.run(
+        args,
+        input=yaml_content.encode(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False
+    )
+    if result.returncode != 0:
+        stderr = result.stderr.decode('utf-8', 'replace').strip()
+        _emit(f"{Colors.FAIL}Error applying YAML: {stderr}{Colors.ENDC}", out)
+        return False
+    return True
 
 
 def run_kubectl_patch(resource_type: str, resource_name: str, namespace: str,
-                      patch: str, patch_type: str = 'json', dry_run: bool = False) -> bool:
+                      patch: str, patch_type: str = 'json', dry_run: bool = False,
+                      out: Optional[List[str]] = None) -> bool:
     """Patch a Kubernetes resource"""
-    for cmd in ['oc', 'kubectl']:
-        try:
-            args = [cmd, 'patch', resource_type, resource_name, '-n', namespace,
-                   '--type', patch_type, '-p', patch]
-            if dry_run:
-                args.append('--dry-run=client')
-
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except FileNotFoundError:
-            continue
-        except subprocess.CalledProcessError as e:
-            print(f"{Colors.FAIL}Error patching resource: {e.stderr}{Colors.ENDC}")
-            return False
-    return False
+    args = [KUBECTL_BIN, 'patch', resource_type, resource_name, '-n', namespace,
+            '--type', patch_type, '-p', patch]
+    if dry_run:
+        args.append('--dry-run=client')
+
+    try:
+        subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return True
+    except subprocess.CalledProcessError as e:
+        _emit(f"{Colors.FAIL}Error patching resource: {e.stderr}{Colors.ENDC}", out)
+        return False
+
 
+def patch_vm_to_use_new_datavolumes(vm: Dict, old_dv_name: str, new_dv_name: str,
+                                     dry_run: bool = False,
+                                     out: Optional[List[str]] = None) -> bool:
+    """Patch VM to use new DataVolume instead of old one.
 
-def patch_vm_to_use_new_datavolumes(vm_name: str, vm_namespace: str,
-                                     old_dv_name: str, new_dv_name: str,
-                                     dry_run: bool = False) -> bool:
-    """Patch VM to use new DataVolume instead of old one"""
+    The VM object comes from the cluster snapshot, so the indices for the
+    JSON patch are computed without an extra GET round-trip. (Strategic
+    merge patches are not supported on custom resources, so RFC6902 by
+    index is the patch type that works for VirtualMachines.)
+    """
     # We need to update two places:
     # 1. spec.dataVolumeTemplates[].metadata.name
     # 2. spec.template.spec.volumes[].dataVolume.name
-
-    # Get current VM to find the indices
-    vm = run_kubectl(['get', 'vm', vm_name, '-n', vm_namespace], check=False)
-    if not vm:
-        return False
+    vm_name = vm['metadata']['name']
+    vm_namespace = vm['metadata']['namespace']
 
     # Build JSON patch operations
     patches = []
@@ -158,12 +383,27 @@ def patch_vm_to_use_new_datavolumes(vm_name: str, vm_namespace: str,
             break
 
     if not patches:
-        print(f"  {Colors.WARNING}⚠️  Could not find DataVolume references in VM{Colors.ENDC}")
+        _emit(f"  {Colors.WARNING}⚠️  Could not find DataVolume references in VM{Colors.ENDC}", out)
         return False
 
-    # Apply patch
-    patch_json = json.dumps(patches)
-    return run_kubectl_patch('vm', vm_name, vm_namespace, patch_json, 'json', dry_run)
+    # With the python client the patch list is passed as-is (a list body is
+    # sent as application/json-patch+json), skipping the serialize/re-parse
+    # round-trip through kubectl entirely
+    api = _get_k8s_api()
+    if api and not dry_run:
+        try:
+            api.patch_namespaced_custom_object(
+                _KUBEVIRT_GROUP, _KUBEVIRT_VERSION, vm_namespace,
+                'virtualmachines', vm_name, patches
+            )
+            return True
+        except Exception:
+            pass  # fall through to kubectl
+
+    # Compact separators keep whitespace out of the patch payload
+    patch_json = json.dumps(patches, separators=(',', ':'))
+    return run_kubectl_patch('vm', vm_name, vm_namespace, patch_json, 'json',
+                             dry_run, out=out)
 
 
 def get_all_vms(namespace: Optional[str] = None) -> List[Dict]:
@@ -174,43 +414,158 @@ def get_all_vms(namespace: Optional[str] = None) -> List[Dict]:
     else:
         cmd.append('--all-namespaces')
 
-    result = run_kubectl(cmd, check=False)
-    return result.get('items', []) if result else []
+    return list(run_kubectl_stream(cmd + [_CHUNK_SIZE_ARG]))
 
 
 def get_datavolumes(namespace: str) -> List[Dict]:
     """Get all DataVolumes in namespace"""
-    result = run_kubectl(['get', 'dv', '-n', namespace], check=False)
-    return result.get('items', []) if result else []
+    return list(run_kubectl_stream(['get', 'dv', '-n', namespace, _CHUNK_SIZE_ARG]))
+
+
+# Kubernetes quantity suffixes: binary (Ki..Ei) and decimal (K..E).
+# Two-character suffixes are checked first so '10Gi' doesn't match 'G'.
+_UNITS = {'Ki': 2**10, 'Mi': 2**20, 'Gi': 2**30, 'Ti': 2**40,
+          'Pi': 2**50, 'Ei': 2**60,
+          'K': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12, 'P': 1e15, 'E': 1e18,
+          'm': 1e-3}
+
 
+def parse_qty(quantity: str) -> float:
+    """Parse a Kubernetes storage quantity ('10Gi', '500Mi', '1.5Ti') into bytes"""
+    for unit, mult in _UNITS.items():
+        if quantity.endswith(unit):
+            return float(quantity[:-len(unit)]) * mult
+    return float(quantity)
 
+
+@functools.lru_cache(maxsize=None)
 def get_storage_class(name: str) -> Optional[Dict]:
-    """Get storage class details"""
+    """Get storage class details (memoized; SC metadata is immutable here)"""
     return run_kubectl(['get', 'sc', name], check=False)
 
 
-def find_vms_using_storage_class(storage_class: str, namespace: Optional[str] = None) -> List[Dict]:
-    """Find all VMs using a specific storage class"""
+# Snapshot results are reused within a short TTL so a plan immediately
+# followed by an execute in the same process doesn't re-list the cluster
+_SNAPSHOT_TTL = 30
+_snapshot_cache: Dict[tuple, tuple] = {}
+
+# On-disk plan cache: 'plan' writes its result here so a subsequent
+# 'execute --use-plan' run skips re-listing the whole cluster
+_PLAN_CACHE_DIR = os.path.expanduser('~/.cache/vm-tree')
+_PLAN_CACHE_TTL = 600
+
+
+def _plan_cache_path(from_sc: str, to_sc: str) -> str:
+    return os.path.join(_PLAN_CACHE_DIR, f'plan-{from_sc}-{to_sc}.json')
+
+
+def save_plan(from_sc: str, to_sc: str, vms_to_migrate: List[Dict],
+              namespace: Optional[str] = None,
+              dv_selector: Optional[str] = None) -> None:
+    """Persist a computed migration plan; failures are non-fatal.
+
+    The namespace and selector the plan was computed with are stored in
+    the payload so 'execute --use-plan' can refuse a plan whose scope
+    doesn't match its own arguments.
+    """
+    try:
+        os.makedirs(_PLAN_CACHE_DIR, exist_ok=True)
+        with open(_plan_cache_path(from_sc, to_sc), 'w') as f:
+            json.dump({'ts': time.time(), 'namespace': namespace,
+                       'selector': dv_selector, 'vms': vms_to_migrate}, f)
+    except OSError:
+        pass
+
+
+def load_plan(from_sc: str, to_sc: str,
+              namespace: Optional[str] = None,
+              dv_selector: Optional[str] = None) -> Optional[List[Dict]]:
+    """Load a previously saved plan if present, fresh and scope-matched,
+    else None"""
+    try:
+        with open(_plan_cache_path(from_sc, to_sc)) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - data.get('ts', 0) > _PLAN_CACHE_TTL:
+        return None
+    if data.get('namespace') != namespace or data.get('selector') != dv_selector:
+        # A plan computed for a different -n / -l scope must never drive
+        # an execute run — patching out-of-scope VMs is worse than
+        # re-listing the cluster
+        return None
+    return data.get('vms')
+
+
+def load_cluster_snapshot(namespace: Optional[str] = None,
+                          dv_selector: Optional[str] = None) -> tuple:
+    """Fetch all VirtualMachines and DataVolumes in two bulk kubectl calls.
+
+    Returns (vms, dvs_by_namespace). VMs are fetched as full JSON (the
+    execute phase needs their volume layout for patching); DataVolumes use
+    the slim jsonpath projection since only a handful of their fields are
+    read, falling back to full JSON if the projection fails. Lists are
+    unpaginated by default (see _CHUNK_SIZE_ARG).
+    """
+    cache_key = (namespace, dv_selector)
+    cached = _snapshot_cache.get(cache_key)
+    if cached and time.time() - cached[0] < _SNAPSHOT_TTL:
+        return cached[1]
+
+    via_client = _load_snapshot_via_client(namespace, dv_selector)
+    if via_client is not None:
+        vms, dvs = via_client
+    else:
+        scope = ['-n', namespace] if namespace else ['--all-namespaces']
+        vms = list(run_kubectl_stream(['get', 'vm'] + scope + [_CHUNK_SIZE_ARG]))
+
+        dvs = get_datavolumes_slim(namespace, dv_selector)
+        if dvs is None:
+            fallback = ['get', 'dv'] + scope
+            if dv_selector:
+                fallback.extend(['-l', dv_selector])
+            dvs = run_kubectl_stream(fallback + [_CHUNK_SIZE_ARG])
+
+    dvs_by_ns: Dict[str, List[Dict]] = defaultdict(list)
+    for dv in dvs:
+        dvs_by_ns[dv['metadata']['namespace']].append(dv)
+
+    _snapshot_cache[cache_key] = (time.time(), (vms, dvs_by_ns))
+    return vms, dvs_by_ns
+
+
+def find_vms_using_storage_class(storage_class: str, namespace: Optional[str] = None,
+                                 dv_selector: Optional[str] = None) -> List[Dict]:
+    """Find all VMs using a specific storage class.
+
+    dv_selector, when given, narrows the DataVolume fetch server-side.
+    DVs carry no storage-class label by default, so the storageClassName
+    check below still runs client-side; the selector lets deployments
+    that do label their DVs skip downloading the rest.
+    """
     vms_to_migrate = []
-    all_vms = get_all_vms(namespace)
+    all_vms, dvs_by_ns = load_cluster_snapshot(namespace, dv_selector)
+
+    # Per namespace: index DataVolumes by owning VM UID, so each VM's DVs
+    # are an O(1) lookup instead of a scan over every DV
+    owner_idx_cache: Dict[str, Dict[str, List[Dict]]] = {}
 
     for vm in all_vms:
         vm_name = vm['metadata']['name']
         vm_namespace = vm['metadata']['namespace']
 
-        # Get DataVolumes for this VM
-        dvs = get_datavolumes(vm_namespace)
+        owner_idx = owner_idx_cache.get(vm_namespace)
+        if owner_idx is None:
+            owner_idx = defaultdict(list)
+            for dv in dvs_by_ns.get(vm_namespace, []):
+                for ref in dv.get('metadata', {}).get('ownerReferences', []):
+                    if ref.get('kind') == 'VirtualMachine':
+                        owner_idx[ref.get('uid')].append(dv)
+            owner_idx_cache[vm_namespace] = owner_idx
 
         # Find DVs owned by this VM
         vm_uid = vm['metadata']['uid']
-        vm_dvs = []
-
-        for dv in dvs:
-            owner_refs = dv.get('metadata', {}).get('ownerReferences', [])
-            for ref in owner_refs:
-                if ref.get('kind') == 'VirtualMachine' and ref.get('uid') == vm_uid:
-                    vm_dvs.append(dv)
-                    break
+        vm_dvs = owner_idx.get(vm_uid, [])
 
         # Check if any DV uses the target storage class
         for dv in vm_dvs:
@@ -225,41 +580,59 @@ def find_vms_using_storage_class(storage_class: str, namespace: Optional[str] =
     return vms_to_migrate
 
 
-def print_migration_plan(from_sc: str, to_sc: str, namespace: Optional[str] = None):
-    """Print migration plan (what will be migrated)"""
-    print("=" * 80)
-    print(f"  {Colors.BOLD}STORAGE MIGRATION PLAN{Colors.ENDC}")
-    print("=" * 80)
-    print()
-    print(f"  From StorageClass: {Colors.WARNING}{from_sc}{Colors.ENDC}")
-    print(f"  To StorageClass:   {Colors.OKGREEN}{to_sc}{Colors.ENDC}")
+def print_migration_plan(from_sc: str, to_sc: str, namespace: Optional[str] = None,
+                         dv_selector: Optional[str] = None):
+    """Print migration plan (what will be migrated).
+
+    Lines are buffered and flushed with a handful of writes rather than
+    one syscall per print; see _flush.
+    """
+    out: List[str] = []
+    w = out.append
+
+    def _flush():
+        if out:
+            sys.stdout.write('\n'.join(out) + '\n')
+            out.clear()
+
+    w("=" * 80)
+    w(f"  {Colors.BOLD}STORAGE MIGRATION PLAN{Colors.ENDC}")
+    w("=" * 80)
+    w("")
+    w(f"  From StorageClass: {Colors.WARNING}{from_sc}{Colors.ENDC}")
+    w(f"  To StorageClass:   {Colors.OKGREEN}{to_sc}{Colors.ENDC}")
     if namespace:
-        print(f"  Namespace:         {namespace}")
+        w(f"  Namespace:         {namespace}")
     else:
-        print(f"  Namespace:         All namespaces")
-    print()
+        w(f"  Namespace:         All namespaces")
+    w("")
 
     # Validate target storage class exists
     target_sc = get_storage_class(to_sc)
     if not target_sc:
-        print(f"{Colors.FAIL}❌ Error: Storage class '{to_sc}' not found!{Colors.ENDC}")
+        w(f"{Colors.FAIL}❌ Error: Storage class '{to_sc}' not found!{Colors.ENDC}")
+        _flush()
         sys.exit(1)
 
-    print(f"{Colors.OKGREEN}✅ Target storage class '{to_sc}' exists{Colors.ENDC}")
-    print()
+    w(f"{Colors.OKGREEN}✅ Target storage class '{to_sc}' exists{Colors.ENDC}")
+    w("")
 
     # Find VMs to migrate
-    print(f"Searching for VMs using storage class '{from_sc}'...")
-    vms_to_migrate = find_vms_using_storage_class(from_sc, namespace)
+    w(f"Searching for VMs using storage class '{from_sc}'...")
+    _flush()
+    vms_to_migrate = find_vms_using_storage_class(from_sc, namespace, dv_selector)
 
     if not vms_to_migrate:
-        print(f"{Colors.WARNING}No VMs found using storage class '{from_sc}'{Colors.ENDC}")
-        print()
-        print("=" * 80)
+        w(f"{Colors.WARNING}No VMs found using storage class '{from_sc}'{Colors.ENDC}")
+        w("")
+        w("=" * 80)
+        _flush()
         return
 
-    print(f"{Colors.OKBLUE}Found {len(vms_to_migrate)} VM(s) to migrate:{Colors.ENDC}")
-    print()
+    save_plan(from_sc, to_sc, vms_to_migrate, namespace, dv_selector)
+
+    w(f"{Colors.OKBLUE}Found {len(vms_to_migrate)} VM(s) to migrate:{Colors.ENDC}")
+    w("")
 
     total_storage = 0
     total_dvs = 0
@@ -272,20 +645,20 @@ def print_migration_plan(from_sc: str, to_sc: str, namespace: Optional[str] = No
         vm_namespace = vm['metadata']['namespace']
         vm_status = vm.get('status', {}).get('printableStatus', 'Unknown')
 
-        print(f"{idx}. {Colors.OKGREEN}VM:{Colors.ENDC} {vm_name} (namespace: {vm_namespace})")
-        print(f"   ├─ Status: {vm_status}")
-        print(f"   ├─ DataVolumes to migrate: {len(dvs)}")
+        w(f"{idx}. {Colors.OKGREEN}VM:{Colors.ENDC} {vm_name} (namespace: {vm_namespace})")
+        w(f"   ├─ Status: {vm_status}")
+        w(f"   ├─ DataVolumes to migrate: {len(dvs)}")
 
         for dv_idx, dv in enumerate(dvs):
             dv_name = dv['metadata']['name']
             dv_size_str = dv.get('spec', {}).get('storage', {}).get('resources', {}).get('requests', {}).get('storage', '0Gi')
             dv_sc = dv.get('spec', {}).get('storage', {}).get('storageClassName', 'N/A')
 
-            # Parse size (simplistic - assumes Gi)
             try:
-                size_gi = int(dv_size_str.replace('Gi', '').replace('G', ''))
-                total_storage += size_gi
-            except:
+                total_storage += parse_qty(dv_size_str)
+            except ValueError:
+                # one odd quantity shouldn't kill the whole report; the
+                # raw string is still printed per-DV below
                 pass
 
             total_dvs += 1
@@ -293,35 +666,171 @@ def print_migration_plan(from_sc: str, to_sc: str, namespace: Optional[str] = No
             is_last = (dv_idx == len(dvs) - 1)
             connector = "└─" if is_last else "├─"
 
-            print(f"   {connector} DataVolume: {dv_name}")
-            print(f"   {'   ' if is_last else '│  '}  ├─ Size: {dv_size_str}")
-            print(f"   {'   ' if is_last else '│  '}  └─ Current StorageClass: {dv_sc}")
-
-        print()
+            w(f"   {connector} DataVolume: {dv_name}")
+            w(f"   {'   ' if is_last else '│  '}  ├─ Size: {dv_size_str}")
+            w(f"   {'   ' if is_last else '│  '}  └─ Current StorageClass: {dv_sc}")
+
+        w("")
+
+    w("=" * 80)
+    w(f"  {Colors.BOLD}MIGRATION SUMMARY{Colors.ENDC}")
+    w("=" * 80)
+    w(f"  VMs to migrate:        {len(vms_to_migrate)}")
+    w(f"  DataVolumes to clone:  {total_dvs}")
+    w(f"  Total storage:         ~{total_storage / 2**30:.1f} Gi")
+    w("")
+    w(f"  {Colors.WARNING}⚠️  Migration will:{Colors.ENDC}")
+    w(f"     1. Create new DataVolumes on '{to_sc}'")
+    w(f"     2. Clone data from existing DataVolumes")
+    w(f"     3. Update VMs to use new DataVolumes")
+    w(f"     4. Mark old DataVolumes as orphaned")
+    w("")
+    w(f"  {Colors.WARNING}⚠️  Recommended steps:{Colors.ENDC}")
+    w(f"     1. Stop all VMs before migration (prevents data corruption)")
+    w(f"     2. Use --dry-run first to test")
+    w(f"     3. Back up critical VMs")
+    w(f"     4. Clean up orphaned resources after verification")
+    w("")
+    w("=" * 80)
+    _flush()
+
+
+def build_datavolume_manifest(new_dv_name: str, namespace: str, source_dv_name: str,
+                              from_sc: str, to_sc: str, access_modes: List[str],
+                              size: str) -> str:
+    """Build the manifest for a migrated DataVolume.
+
+    Constructed as a dict and serialized, so storage-class or DV names
+    never need escaping into a YAML template. Dumped with PyYAML when
+    installed, else as JSON — kubectl accepts both, including in '---'
+    separated multi-document streams.
+    """
+    body = {
+        'apiVersion': 'cdi.kubevirt.io/v1beta1',
+        'kind': 'DataVolume',
+        'metadata': {
+            'name': new_dv_name,
+            'namespace': namespace,
+            'labels': {
+                'storage-migration': 'true',
+                'source-sc': from_sc,
+                'target-sc': to_sc,
+            },
+            'annotations': {
+                'migration-timestamp': datetime.now().isoformat(),
+            },
+        },
+        'spec': {
+            'source': {
+                'pvc': {
+                    'namespace': namespace,
+                    'name': source_dv_name,
+                },
+            },
+            'storage': {
+                'storageClassName': to_sc,
+                'accessModes': list(access_modes),
+                'resources': {
+                    'requests': {'storage': size},
+                },
+            },
+        },
+    }
+    if yaml is not None:
+        return yaml.dump(body, Dumper=_YAML_DUMPER, sort_keys=False)
+    return json.dumps(body, indent=2)
+
+
+def _migrate_one_vm(idx: int, total: int, item: Dict, from_sc: str, to_sc: str,
+                    dry_run: bool = False, refresh_vm: bool = False) -> List[str]:
+    """Migrate a single VM's DataVolumes; returns its log lines.
+
+    Runs on a worker thread, so output is collected and returned rather
+    than printed — the caller emits each VM's lines atomically. With
+    refresh_vm (set when the plan came from the on-disk cache) the VM is
+    re-fetched before patching, since the JSON patches address volumes by
+    index and a cached spec may be stale.
+    """
+    vm = item['vm']
+    dvs = item['datavolumes']
+
+    vm_name = vm['metadata']['name']
+    vm_namespace = vm['metadata']['namespace']
+
+    out = [f"[{idx}/{total}] Migrating VM: {Colors.OKGREEN}{vm_name}{Colors.ENDC}"]
+
+    # Track old → new DV name mapping for this VM
+    dv_mapping = {}
+
+    # Manifests accumulated for a single batched apply
+    pending: List[tuple] = []
+
+    # Step 1: Create new DataVolumes
+    for dv in dvs:
+        dv_name = dv['metadata']['name']
+        dv_size = dv.get('spec', {}).get('storage', {}).get('resources', {}).get('requests', {}).get('storage', '5Gi')
+        dv_access_modes = dv.get('spec', {}).get('storage', {}).get('accessModes', ['ReadWriteOnce'])
+
+        new_dv_name = f"{dv_name}-migrated-{uuid.uuid4().hex[:8]}"
+        dv_mapping[dv_name] = new_dv_name  # Store mapping
+
+        out.append(f"  Creating new DataVolume: {new_dv_name}")
+
+        new_dv_yaml = build_datavolume_manifest(
+            new_dv_name, vm_namespace, dv_name, from_sc, to_sc,
+            dv_access_modes, dv_size
+        )
+
+        if dry_run:
+            out.append(f"  {Colors.OKCYAN}[DRY RUN] Would create:{Colors.ENDC}")
+            out.append(new_dv_yaml)
+        else:
+            pending.append((dv_name, new_dv_name, new_dv_yaml))
+
+    # Apply all of this VM's new DVs in one kubectl call; on failure, retry
+    # one at a time so the failing manifest is identifiable
+    if pending:
+        batch = '\n---\n'.join(y for _, _, y in pending)
+        if run_kubectl_apply(batch, dry_run=False, out=out):
+            out.append(f"  {Colors.OKGREEN}✅ {len(pending)} DataVolume(s) created{Colors.ENDC}")
+        else:
+            for dv_name, new_dv_name, dv_yaml in pending:
+                if run_kubectl_apply(dv_yaml, dry_run=False, out=out):
+                    out.append(f"  {Colors.OKGREEN}✅ DataVolume created: {new_dv_name}{Colors.ENDC}")
+                else:
+                    out.append(f"  {Colors.FAIL}❌ Failed to create DataVolume: {new_dv_name}{Colors.ENDC}")
+                    dv_mapping.pop(dv_name, None)
+
+    # Step 2: Update VM spec to use new DataVolumes
+    out.append(f"  Updating VM spec to use new DataVolumes...")
+
+    if refresh_vm and dv_mapping and not dry_run:
+        fresh_vm = run_kubectl(['get', 'vm', vm_name, '-n', vm_namespace], check=False)
+        if fresh_vm is None:
+            out.append(f"  {Colors.FAIL}❌ Could not re-fetch VM to validate cached plan; skipping patch{Colors.ENDC}")
+            out.append("")
+            return out
+        vm = fresh_vm
+
+    for old_dv_name, new_dv_name in dv_mapping.items():
+        if dry_run:
+            out.append(f"  {Colors.OKCYAN}[DRY RUN] Would patch VM: {old_dv_name} → {new_dv_name}{Colors.ENDC}")
+        else:
+            success = patch_vm_to_use_new_datavolumes(
+                vm, old_dv_name, new_dv_name, dry_run=False, out=out
+            )
+            if success:
+                out.append(f"  {Colors.OKGREEN}✅ VM patched: {old_dv_name} → {new_dv_name}{Colors.ENDC}")
+            else:
+                out.append(f"  {Colors.FAIL}❌ Failed to patch VM{Colors.ENDC}")
 
-    print("=" * 80)
-    print(f"  {Colors.BOLD}MIGRATION SUMMARY{Colors.ENDC}")
-    print("=" * 80)
-    print(f"  VMs to migrate:        {len(vms_to_migrate)}")
-    print(f"  DataVolumes to clone:  {total_dvs}")
-    print(f"  Total storage:         ~{total_storage} Gi")
-    print()
-    print(f"  {Colors.WARNING}⚠️  Migration will:{Colors.ENDC}")
-    print(f"     1. Create new DataVolumes on '{to_sc}'")
-    print(f"     2. Clone data from existing DataVolumes")
-    print(f"     3. Update VMs to use new DataVolumes")
-    print(f"     4. Mark old DataVolumes as orphaned")
-    print()
-    print(f"  {Colors.WARNING}⚠️  Recommended steps:{Colors.ENDC}")
-    print(f"     1. Stop all VMs before migration (prevents data corruption)")
-    print(f"     2. Use --dry-run first to test")
-    print(f"     3. Back up critical VMs")
-    print(f"     4. Clean up orphaned resources after verification")
-    print()
-    print("=" * 80)
+    out.append("")
+    return out
 
 
-def execute_migration(from_sc: str, to_sc: str, namespace: Optional[str] = None, dry_run: bool = False):
+def execute_migration(from_sc: str, to_sc: str, namespace: Optional[str] = None, dry_run: bool = False,
+                      parallelism: int = 8, dv_selector: Optional[str] = None,
+                      use_plan: bool = False):
     """Execute the migration"""
     print("=" * 80)
     print(f"  {Colors.BOLD}EXECUTING STORAGE MIGRATION{Colors.ENDC}")
@@ -331,7 +840,16 @@ def execute_migration(from_sc: str, to_sc: str, namespace: Optional[str] = None,
     print()
 
     # Get VMs to migrate
-    vms_to_migrate = find_vms_using_storage_class(from_sc, namespace)
+    vms_to_migrate = None
+    from_cached_plan = False
+    if use_plan:
+        vms_to_migrate = load_plan(from_sc, to_sc, namespace, dv_selector)
+        if vms_to_migrate is None:
+            print(f"{Colors.WARNING}No fresh cached plan for this scope; re-listing the cluster{Colors.ENDC}")
+        else:
+            from_cached_plan = True
+    if vms_to_migrate is None:
+        vms_to_migrate = find_vms_using_storage_class(from_sc, namespace, dv_selector)
 
     if not vms_to_migrate:
         print(f"{Colors.WARNING}No VMs found to migrate.{Colors.ENDC}")
@@ -340,87 +858,19 @@ def execute_migration(from_sc: str, to_sc: str, namespace: Optional[str] = None,
     print(f"Migrating {len(vms_to_migrate)} VM(s)...")
     print()
 
-    for idx, item in enumerate(vms_to_migrate, 1):
-        vm = item['vm']
-        dvs = item['datavolumes']
-
-        vm_name = vm['metadata']['name']
-        vm_namespace = vm['metadata']['namespace']
+    # Each VM needs several kubectl round-trips dominated by server latency,
+    # so independent VMs migrate on worker threads. Results come back in
+    # submission order and each VM's lines are emitted atomically.
+    total = len(vms_to_migrate)
 
-        print(f"[{idx}/{len(vms_to_migrate)}] Migrating VM: {Colors.OKGREEN}{vm_name}{Colors.ENDC}")
+    def worker(pair):
+        idx, item = pair
+        return _migrate_one_vm(idx, total, item, from_sc, to_sc, dry_run,
+                               refresh_vm=from_cached_plan)
 
-        # Track old → new DV name mapping for this VM
-        dv_mapping = {}
-
-        # Step 1: Create new DataVolumes
-        for dv in dvs:
-            dv_name = dv['metadata']['name']
-            dv_size = dv.get('spec', {}).get('storage', {}).get('resources', {}).get('requests', {}).get('storage', '5Gi')
-            dv_access_modes = dv.get('spec', {}).get('storage', {}).get('accessModes', ['ReadWriteOnce'])
-
-            new_dv_name = f"{dv_name}-migrated-{int(time.time())}"
-            dv_mapping[dv_name] = new_dv_name  # Store mapping
-
-            print(f"  Creating new DataVolume: {new_dv_name}")
-
-            # Create new DataVolume YAML
-            timestamp = datetime.now().isoformat()
-            new_dv_yaml = f"""
-apiVersion: cdi.kubevirt.io/v1beta1
-kind: DataVolume
-metadata:
-  name: {new_dv_name}
-  namespace: {vm_namespace}
-  labels:
-    storage-migration: "true"
-    source-sc: "{from_sc}"
-    target-sc: "{to_sc}"
-  annotations:
-    migration-timestamp: "{timestamp}"
-spec:
-  source:
-    pvc:
-      namespace: {vm_namespace}
-      name: {dv_name}
-  storage:
-    storageClassName: {to_sc}
-    accessModes:
-{chr(10).join(f'      - {mode}' for mode in dv_access_modes)}
-    resources:
-      requests:
-        storage: {dv_size}
-"""
-
-            if dry_run:
-                print(f"  {Colors.OKCYAN}[DRY RUN] Would create:{Colors.ENDC}")
-                print(new_dv_yaml)
-            else:
-                success = run_kubectl_apply(new_dv_yaml, dry_run=False)
-                if success:
-                    print(f"  {Colors.OKGREEN}✅ DataVolume created{Colors.ENDC}")
-                else:
-                    print(f"  {Colors.FAIL}❌ Failed to create DataVolume{Colors.ENDC}")
-                    continue
-
-            # Small delay to ensure unique timestamps
-            time.sleep(0.1)
-
-        # Step 2: Update VM spec to use new DataVolumes
-        print(f"  Updating VM spec to use new DataVolumes...")
-
-        for old_dv_name, new_dv_name in dv_mapping.items():
-            if dry_run:
-                print(f"  {Colors.OKCYAN}[DRY RUN] Would patch VM: {old_dv_name} → {new_dv_name}{Colors.ENDC}")
-            else:
-                success = patch_vm_to_use_new_datavolumes(
-                    vm_name, vm_namespace, old_dv_name, new_dv_name, dry_run=False
-                )
-                if success:
-                    print(f"  {Colors.OKGREEN}✅ VM patched: {old_dv_name} → {new_dv_name}{Colors.ENDC}")
-                else:
-                    print(f"  {Colors.FAIL}❌ Failed to patch VM{Colors.ENDC}")
-
-        print()
+    with ThreadPoolExecutor(max_workers=max(1, parallelism)) as executor:
+        for lines in executor.map(worker, enumerate(vms_to_migrate, 1)):
+            sys.stdout.write('\n'.join(lines) + '\n')
 
     print("=" * 80)
     if dry_run:
@@ -465,37 +915,42 @@ Examples:
     parser.add_argument('--to-sc', '--to-storage-class', required=True, dest='to_sc',
                         help='Target storage class to migrate to')
     parser.add_argument('-n', '--namespace', help='Kubernetes namespace (default: searches all)')
+    parser.add_argument('-l', '--selector', metavar='SELECTOR',
+                        help='Label selector to narrow the DataVolume search server-side')
     parser.add_argument('--dry-run', action='store_true',
                         help='Dry run mode (only for execute mode)')
+    parser.add_argument('--parallelism', type=int, default=8, metavar='N',
+                        help='Number of VMs to migrate concurrently (default: 8)')
+    parser.add_argument('--use-plan', action='store_true',
+                        help='Execute from the plan cached by a recent "plan" run '
+                             'instead of re-listing the cluster')
     parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+    parser.add_argument('--use-kubectl', action='store_true',
+                        help='Always shell out to oc/kubectl, even if the python '
+                             'kubernetes client is installed')
 
     args = parser.parse_args()
 
+    if args.use_kubectl:
+        global _CLIENT_DISABLED
+        _CLIENT_DISABLED = True
+
     # Disable colors if requested
     if args.no_color:
-        for attr in dir(Colors):
-            if not attr.startswith('_'):
-                setattr(Colors, attr, '')
-
-    # Check if kubectl/oc is available
-    cmd_available = False
-    for cmd in ['oc', 'kubectl']:
-        try:
-            subprocess.run([cmd, 'version'], capture_output=True, check=True)
-            cmd_available = True
-            break
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
+        _disable_colors()
 
-    if not cmd_available:
+    # Check if kubectl/oc is available (local PATH lookup only; no server
+    # round-trip — any connectivity problem surfaces on the first real call)
+    if not KUBECTL_BIN:
         print(f"{Colors.FAIL}Error: Neither 'oc' nor 'kubectl' command found.{Colors.ENDC}")
         sys.exit(1)
 
     # Execute mode
     if args.mode == 'plan':
-        print_migration_plan(args.from_sc, args.to_sc, args.namespace)
+        print_migration_plan(args.from_sc, args.to_sc, args.namespace, args.selector)
     elif args.mode == 'execute':
-        execute_migration(args.from_sc, args.to_sc, args.namespace, args.dry_run)
+        execute_migration(args.from_sc, args.to_sc, args.namespace, args.dry_run,
+                          args.parallelism, args.selector, args.use_plan)
 
 
 if __name__ == '__main__':
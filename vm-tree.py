@@ -16,10 +16,17 @@ Example:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
+import shutil
 import subprocess
 import sys
-from typing import Dict, List, Optional, Any
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Any
 
 
 class Colors:
@@ -35,100 +42,751 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
-def run_oc(args: List[str], check=True) -> Dict[str, Any]:
-    """Run oc/kubectl command and return parsed JSON output"""
-    # Try oc first, then kubectl
-    for cmd in ['oc', 'kubectl']:
+def _disable_colors():
+    """Blank out every color code (assigned directly — no dir() reflection)"""
+    Colors.HEADER = Colors.OKBLUE = Colors.OKCYAN = Colors.OKGREEN = ''
+    Colors.WARNING = Colors.FAIL = Colors.ENDC = Colors.BOLD = ''
+    Colors.UNDERLINE = ''
+
+
+# Honor NO_COLOR and piped output without waiting for the --no-color flag
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    _disable_colors()
+
+
+# Resolved lazily and memoized so every call doesn't redo the PATH probe
+# (and, on kubectl-only systems, a failed exec of 'oc')
+_OC_BIN: Optional[str] = None
+
+
+def _oc_bin() -> Optional[str]:
+    """Resolve the oc/kubectl binary once; 'oc' preferred"""
+    global _OC_BIN
+    if _OC_BIN is None:
+        _OC_BIN = shutil.which('oc') or shutil.which('kubectl') or ''
+    return _OC_BIN or None
+
+
+# orjson decodes multi-MB list responses several times faster than stdlib
+# json and accepts bytes directly, skipping the UTF-8 decode hop
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+
+def run_oc(args: List[str]) -> Dict[str, Any]:
+    """Run oc/kubectl command and return parsed JSON output, or None on
+    any failure.
+
+    Read-only (get) commands honour --cache-ttl: a response younger than
+    the TTL is replayed from disk instead of hitting the apiserver.
+    """
+    cacheable = _CACHE_TTL and args and args[0] == 'get'
+    if cacheable:
+        cached = _cmd_cache_load(args, '.json')
+        if cached is not None:
+            try:
+                return _loads(cached)
+            except ValueError:
+                pass
+    cmd = _oc_bin()
+    if not cmd:
+        return None
+    # stdout only — errors aren't surfaced to the user anyway, so the
+    # stderr pipe setup per call is skipped
+    result = subprocess.run(
+        [cmd] + args + ['-o', 'json'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    if result.returncode != 0 or not result.stdout:
+        return None
+    try:
+        parsed = _loads(result.stdout)
+    except ValueError:
+        # covers json.JSONDecodeError and orjson.JSONDecodeError alike
+        return None
+    if cacheable:
+        _cmd_cache_store(args, '.json', result.stdout)
+    return parsed
+
+
+_IJSON = None
+
+
+def _ijson():
+    """Return the ijson module if installed, else False (memoized)"""
+    global _IJSON
+    if _IJSON is None:
         try:
-            result = subprocess.run(
-                [cmd] + args + ['-o', 'json'],
-                capture_output=True,
-                text=True,
-                check=check
-            )
-            if result.returncode != 0:
+            import ijson
+            _IJSON = ijson
+        except ImportError:
+            _IJSON = False
+    return _IJSON
+
+
+def run_oc_stream(args: List[str]):
+    """Yield items from an oc/kubectl list response one resource at a time.
+
+    With ijson installed, items are parsed incrementally off the subprocess
+    pipe — no full-response text buffer, and callers can filter while oc is
+    still writing. metadata.managedFields (the bulkiest subtree nobody
+    reads) is dropped from each item. Without ijson this delegates to
+    run_oc and yields from the parsed list.
+    """
+    ij = _ijson()
+    if not ij:
+        result = run_oc(args)
+        yield from (result.get('items', []) if result else [])
+        return
+
+    cmd = _oc_bin()
+    if not cmd:
+        return
+
+    proc = subprocess.Popen(
+        [cmd] + args + ['-o', 'json'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        for item in ij.items(proc.stdout, 'items.item'):
+            item.get('metadata', {}).pop('managedFields', None)
+            yield item
+    finally:
+        proc.stdout.close()
+        proc.wait()
+
+
+# API paths for direct REST access, keyed by the kubectl short name
+_REST_PATHS = {
+    'vm': ('apis/kubevirt.io/v1', 'virtualmachines'),
+    'dv': ('apis/cdi.kubevirt.io/v1beta1', 'datavolumes'),
+    'pvc': ('api/v1', 'persistentvolumeclaims'),
+    'pv': ('api/v1', 'persistentvolumes'),
+}
+
+_REST = None
+
+
+def _remove_quiet(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _rest_session():
+    """Return (requests.Session, api_server_url) for direct REST, or False.
+
+    A persistent session reuses one TLS connection across every query,
+    where each oc fork pays kubeconfig parsing plus a fresh handshake.
+    Probed once; False when requests/PyYAML are missing or the kubeconfig
+    can't be loaded, in which case everything stays on the CLI path.
+    """
+    global _REST
+    if _REST is not None:
+        return _REST
+
+    try:
+        import requests
+        import yaml
+    except ImportError:
+        _REST = False
+        return _REST
+
+    import base64
+    import tempfile
+
+    cfg_path = os.environ.get('KUBECONFIG', os.path.expanduser('~/.kube/config'))
+    try:
+        with open(cfg_path) as f:
+            cfg = yaml.safe_load(f)
+        ctx_name = cfg['current-context']
+        ctx = next(c['context'] for c in cfg['contexts'] if c['name'] == ctx_name)
+        cluster = next(c['cluster'] for c in cfg['clusters'] if c['name'] == ctx['cluster'])
+        user = next(u['user'] for u in cfg['users'] if u['name'] == ctx['user'])
+        server = cluster['server']
+    except Exception:
+        _REST = False
+        return _REST
+
+    def _materialize(data):
+        # requests wants file paths for certs; inline kubeconfig data is
+        # base64, so write it to a private temp file, removed at exit so
+        # repeated invocations (dashboards, watch loops) don't litter /tmp
+        import atexit
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.pem')
+        tmp.write(base64.b64decode(data))
+        tmp.close()
+        atexit.register(_remove_quiet, tmp.name)
+        return tmp.name
+
+    try:
+        session = requests.Session()
+        if cluster.get('insecure-skip-tls-verify'):
+            session.verify = False
+        elif 'certificate-authority' in cluster:
+            session.verify = cluster['certificate-authority']
+        elif 'certificate-authority-data' in cluster:
+            session.verify = _materialize(cluster['certificate-authority-data'])
+
+        if user.get('token'):
+            session.headers['Authorization'] = f"Bearer {user['token']}"
+        elif 'client-certificate' in user and 'client-key' in user:
+            session.cert = (user['client-certificate'], user['client-key'])
+        elif 'client-certificate-data' in user and 'client-key-data' in user:
+            session.cert = (_materialize(user['client-certificate-data']),
+                            _materialize(user['client-key-data']))
+    except Exception:
+        _REST = False
+        return _REST
+
+    _REST = (session, server.rstrip('/'))
+    return _REST
+
+
+_K8S = None
+
+
+def _get_k8s_api():
+    """Return (CustomObjectsApi, CoreV1Api) from the kubernetes package,
+    or False when it isn't installed or no kubeconfig loads (memoized)"""
+    global _K8S
+    if _K8S is not None:
+        return _K8S
+    try:
+        from kubernetes import client, config
+        config.load_kube_config()
+        _K8S = (client.CustomObjectsApi(), client.CoreV1Api())
+    except Exception:
+        _K8S = False
+    return _K8S
+
+
+def _client_list(kind: str, namespace: Optional[str] = None) -> Optional[List[Dict]]:
+    """List a resource through the kubernetes client, or None to fall back.
+
+    The client keeps one authenticated connection for the whole process,
+    so repeated lists skip the fork+TLS+auth cost of a CLI call. Core
+    resources are fetched with _preload_content=False and parsed as raw
+    JSON so the items keep the camelCase shape the rest of the code reads.
+    Pages with limit/continue tokens — same bound as the CLI path's
+    --chunk-size — so huge clusters never force one unbounded response.
+    """
+    api = _get_k8s_api()
+    if not api:
+        return None
+    custom, core = api
+    try:
+        items: List[Dict] = []
+        kwargs: Dict[str, Any] = {'limit': _LIST_CHUNK_SIZE}
+        if kind in ('vm', 'dv'):
+            path, plural = _REST_PATHS[kind]
+            _, group, version = path.split('/')
+            while True:
+                if namespace:
+                    resp = custom.list_namespaced_custom_object(
+                        group, version, namespace, plural, **kwargs)
+                else:
+                    resp = custom.list_cluster_custom_object(
+                        group, version, plural, **kwargs)
+                items.extend(resp.get('items', []))
+                cont = resp.get('metadata', {}).get('continue')
+                if not cont:
+                    return items
+                kwargs['_continue'] = cont
+        if kind == 'pvc':
+            if namespace:
+                fetch = functools.partial(
+                    core.list_namespaced_persistent_volume_claim, namespace)
+            else:
+                fetch = core.list_persistent_volume_claim_for_all_namespaces
+        elif kind == 'pv':
+            fetch = core.list_persistent_volume
+        else:
+            return None
+        while True:
+            page = _loads(fetch(_preload_content=False, **kwargs).data)
+            items.extend(page.get('items', []))
+            cont = page.get('metadata', {}).get('continue')
+            if not cont:
+                return items
+            kwargs['_continue'] = cont
+    except Exception:
+        return None
+
+
+_PROXY = None
+
+
+def _proxy_session():
+    """Return (requests.Session, base_url) backed by a kubectl proxy, or False.
+
+    Spawns 'kubectl proxy --port=0' once and keeps it for the process
+    lifetime, so authentication is paid a single time and all queries share
+    one keep-alive HTTP connection. Opt-in via VMTREE_PROXY=1 — useful when
+    the kubeconfig needs an exec credential plugin the direct REST path
+    can't handle.
+    """
+    global _PROXY
+    if _PROXY is not None:
+        return _PROXY
+
+    if os.environ.get('VMTREE_PROXY') != '1':
+        _PROXY = False
+        return _PROXY
+
+    try:
+        import requests
+    except ImportError:
+        _PROXY = False
+        return _PROXY
+
+    cmd = _oc_bin()
+    if not cmd:
+        _PROXY = False
+        return _PROXY
+
+    import atexit
+    import re
+    try:
+        proc = subprocess.Popen(
+            [cmd, 'proxy', '--port=0'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        # kubectl announces "Starting to serve on 127.0.0.1:<port>"
+        match = re.search(r':(\d+)', proc.stdout.readline())
+        if not match:
+            proc.terminate()
+            _PROXY = False
+            return _PROXY
+        atexit.register(proc.terminate)
+        _PROXY = (requests.Session(), f'http://127.0.0.1:{match.group(1)}')
+    except Exception:
+        _PROXY = False
+    return _PROXY
+
+
+def _rest_list(kind: str, namespace: Optional[str] = None) -> Optional[List[Dict]]:
+    """List a resource over direct REST or the kubectl proxy gateway,
+    or None to use the CLI path.
+
+    Pages with ?limit= and metadata.continue tokens, matching the CLI
+    path's --chunk-size bound.
+    """
+    rest = _rest_session() or _proxy_session()
+    if not rest:
+        return None
+    session, server = rest
+
+    api, plural = _REST_PATHS[kind]
+    if namespace and kind != 'pv':
+        url = f'{server}/{api}/namespaces/{namespace}/{plural}'
+    else:
+        url = f'{server}/{api}/{plural}'
+
+    try:
+        items: List[Dict] = []
+        params: Dict[str, Any] = {'limit': _LIST_CHUNK_SIZE}
+        while True:
+            resp = session.get(url, params=params, timeout=30)
+            if resp.status_code != 200:
                 return None
-            return json.loads(result.stdout) if result.stdout else None
-        except FileNotFoundError:
-            continue  # Try next command
-        except subprocess.CalledProcessError:
+            page = resp.json()
+            items.extend(page.get('items', []))
+            cont = page.get('metadata', {}).get('continue')
+            if not cont:
+                return items
+            params['continue'] = cont
+    except Exception:
+        return None
+
+
+# Page size for list calls; keeps apiserver memory bounded on big clusters
+# while run_oc_stream decodes each page's items as they arrive
+_LIST_CHUNK_SIZE = 500
+
+
+def iter_resource(kind: str, namespace: Optional[str] = None,
+                  namespaced: bool = True):
+    """Stream a resource list one item at a time.
+
+    kubectl handles the --chunk-size pagination (following continue tokens
+    internally) and run_oc_stream yields items incrementally, so filtering
+    overlaps the network transfer and peak memory stays O(chunk). When a
+    direct REST session is available it is preferred — one kept-alive TLS
+    connection instead of a CLI fork per list.
+    """
+    items = _client_list(kind, namespace)
+    if items is None:
+        items = _rest_list(kind, namespace)
+    if items is not None:
+        return iter(items)
+
+    cmd = ['get', kind]
+    if namespace:
+        cmd.extend(['-n', namespace])
+    elif namespaced:
+        cmd.append('--all-namespaces')
+    cmd.append(f'--chunk-size={_LIST_CHUNK_SIZE}')
+    if _CACHE_TTL:
+        # With --cache-ttl, route through run_oc so the response lands in
+        # the command cache — trading the incremental parse for a warm run
+        # that skips the apiserver entirely
+        result = run_oc(cmd)
+        return iter(result.get('items', [])) if result else iter(())
+    return run_oc_stream(cmd)
+
+
+# Single-object getters are lru_cached: this tool is read-only, so a
+# resource fetched once per invocation never needs refetching. List
+# results get a short TTL cache keyed on (kind, namespace) so overlapping
+# code paths (tree + orphan scan + storage-class report) share one fetch.
+_LIST_TTL = 30
+_list_cache: Dict[tuple, tuple] = {}
+
+# Optional on-disk cache for repeated invocations (dashboards, watch
+# loops): --cache-ttl N reuses list responses younger than N seconds so
+# back-to-back runs don't re-LIST the world from the apiserver.
+_CACHE_DIR = os.path.expanduser('~/.cache/vm-tree')
+_CACHE_TTL = 0  # seconds; 0 = disabled, set from --cache-ttl
+
+
+def _disk_cache_path(kind: str, namespace: Optional[str]) -> str:
+    return os.path.join(_CACHE_DIR, f"{kind}-{namespace or 'all'}.json")
+
+
+def _disk_cache_load(kind: str, namespace: Optional[str]) -> Optional[List[Dict]]:
+    if not _CACHE_TTL:
+        return None
+    path = _disk_cache_path(kind, namespace)
+    try:
+        if time.time() - os.path.getmtime(path) >= _CACHE_TTL:
             return None
-        except json.JSONDecodeError:
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def _disk_cache_store(kind: str, namespace: Optional[str], items: List[Dict]):
+    if not _CACHE_TTL:
+        return
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_disk_cache_path(kind, namespace), 'w') as f:
+            json.dump(items, f)
+    except (OSError, TypeError):
+        pass
+
+
+# Command-level cache for the fetches that don't flow through _cached_list
+# (field-selector queries, jsonpath projections, streamed scans). Keyed on
+# the full argument vector so differently-scoped queries never collide.
+def _cmd_cache_path(args: List[str], suffix: str) -> str:
+    digest = hashlib.sha1(' '.join(args).encode()).hexdigest()[:16]
+    return os.path.join(_CACHE_DIR, f'cmd-{digest}{suffix}')
+
+
+def _cmd_cache_load(args: List[str], suffix: str) -> Optional[bytes]:
+    if not _CACHE_TTL:
+        return None
+    path = _cmd_cache_path(args, suffix)
+    try:
+        if time.time() - os.path.getmtime(path) >= _CACHE_TTL:
             return None
-    return None
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cmd_cache_store(args: List[str], suffix: str, data: bytes):
+    if not _CACHE_TTL:
+        return
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_cmd_cache_path(args, suffix), 'wb') as f:
+            f.write(data)
+    except OSError:
+        pass
+
+
+# In-flight dedup: when worker threads request the same list concurrently
+# (before the TTL cache is populated), the second caller waits on the
+# first fetch's Future instead of issuing a duplicate query
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _cached_list(kind: str, namespace: Optional[str] = None,
+                 namespaced: bool = True) -> List[Dict]:
+    key = (kind, namespace)
+    cached = _list_cache.get(key)
+    if cached and time.time() - cached[0] < _LIST_TTL:
+        return cached[1]
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is not None:
+            owner = False
+        else:
+            future = Future()
+            _inflight[key] = future
+            owner = True
+    if not owner:
+        return future.result()
+
+    try:
+        items = _disk_cache_load(kind, namespace)
+        if items is None:
+            items = list(iter_resource(kind, namespace, namespaced))
+            _disk_cache_store(kind, namespace, items)
+        _list_cache[key] = (time.time(), items)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(items)
+        return items
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
 
+@functools.lru_cache(maxsize=2048)
 def get_vm(name: str, namespace: str) -> Optional[Dict]:
     """Get VirtualMachine resource"""
-    return run_oc(['get', 'vm', name, '-n', namespace], check=False)
+    return run_oc(['get', 'vm', name, '-n', namespace])
 
 
 def get_datavolumes(namespace: str) -> List[Dict]:
     """Get all DataVolumes in namespace"""
-    result = run_oc(['get', 'dv', '-n', namespace], check=False)
-    return result.get('items', []) if result else []
+    return _cached_list('dv', namespace)
 
 
+@functools.lru_cache(maxsize=2048)
 def get_pvc(name: str, namespace: str) -> Optional[Dict]:
     """Get PersistentVolumeClaim resource"""
-    return run_oc(['get', 'pvc', name, '-n', namespace], check=False)
+    return run_oc(['get', 'pvc', name, '-n', namespace])
 
 
+@functools.lru_cache(maxsize=2048)
 def get_pv(name: str) -> Optional[Dict]:
     """Get PersistentVolume resource"""
-    return run_oc(['get', 'pv', name], check=False)
+    return run_oc(['get', 'pv', name])
 
 
 def get_all_vms(namespace: Optional[str] = None) -> List[Dict]:
     """Get all VMs in namespace or all namespaces"""
-    cmd = ['get', 'vm']
-    if namespace:
-        cmd.extend(['-n', namespace])
-    else:
-        cmd.append('--all-namespaces')
-
-    result = run_oc(cmd, check=False)
-    return result.get('items', []) if result else []
+    return _cached_list('vm', namespace)
 
 
 def get_all_datavolumes(namespace: Optional[str] = None) -> List[Dict]:
     """Get all DataVolumes in namespace or all namespaces"""
-    cmd = ['get', 'dv']
-    if namespace:
-        cmd.extend(['-n', namespace])
-    else:
-        cmd.append('--all-namespaces')
-
-    result = run_oc(cmd, check=False)
-    return result.get('items', []) if result else []
+    return _cached_list('dv', namespace)
 
 
 def get_all_pvcs(namespace: Optional[str] = None) -> List[Dict]:
     """Get all PVCs in namespace or all namespaces"""
-    cmd = ['get', 'pvc']
-    if namespace:
-        cmd.extend(['-n', namespace])
-    else:
-        cmd.append('--all-namespaces')
-
-    result = run_oc(cmd, check=False)
-    return result.get('items', []) if result else []
+    return _cached_list('pvc', namespace)
 
 
 def get_all_pvs() -> List[Dict]:
     """Get all PVs in the cluster"""
-    result = run_oc(['get', 'pv'], check=False)
-    return result.get('items', []) if result else []
+    return _cached_list('pv', namespaced=False)
+
+
+def run_oc_raw(args: List[str]) -> Optional[str]:
+    """Run oc/kubectl command and return raw stdout (no JSON parsing).
+
+    Like run_oc, get commands honour --cache-ttl via the on-disk command
+    cache.
+    """
+    cacheable = _CACHE_TTL and args and args[0] == 'get'
+    if cacheable:
+        cached = _cmd_cache_load(args, '.txt')
+        if cached is not None:
+            return cached.decode()
+    cmd = _oc_bin()
+    if not cmd:
+        return None
+    result = subprocess.run(
+        [cmd] + args,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    if result.returncode != 0:
+        return None
+    if cacheable:
+        _cmd_cache_store(args, '.txt', result.stdout.encode())
+    return result.stdout
+
 
+# The VM tree only reads a few fields from each PVC and PV, so these
+# jsonpath projections ask the server for just those — a few dozen bytes
+# per object instead of the full spec/status.
+_PVC_JSONPATH = ('-o=jsonpath={range .items[*]}{.metadata.name}{"\\t"}'
+                 '{.status.phase}{"\\t"}{.spec.volumeName}{"\\n"}{end}')
+_PV_JSONPATH = ('-o=jsonpath={range .items[*]}{.metadata.name}{"\\t"}'
+                '{.spec.capacity.storage}{"\\t"}'
+                '{.spec.persistentVolumeReclaimPolicy}{"\\n"}{end}')
+
+
+def get_pvcs_slim(namespace: str) -> Optional[List[Dict]]:
+    """Get the namespace's PVCs with only the fields print_vm_tree reads.
+
+    Returns None if the jsonpath query fails, so the caller can fall back
+    to the full list.
+    """
+    output = run_oc_raw(['get', 'pvc', '-n', namespace, _PVC_JSONPATH])
+    if output is None:
+        return None
+
+    pvcs = []
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 3:
+            continue
+        name, phase, volume_name = fields
+        pvcs.append({
+            'metadata': {'name': name, 'namespace': namespace},
+            'spec': {'volumeName': volume_name or None},
+            'status': {'phase': phase or 'Unknown'},
+        })
+    return pvcs
+
+
+def get_pvs_slim() -> Optional[List[Dict]]:
+    """Get all PVs with only the fields print_vm_tree reads (or None)"""
+    output = run_oc_raw(['get', 'pv', _PV_JSONPATH])
+    if output is None:
+        return None
+
+    pvs = []
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 3:
+            continue
+        name, capacity, reclaim = fields
+        pvs.append({
+            'metadata': {'name': name},
+            'spec': {
+                'capacity': {'storage': capacity or 'N/A'},
+                'persistentVolumeReclaimPolicy': reclaim or 'N/A',
+            },
+        })
+    return pvs
+
+
+# The storage-class report only correlates DV owner/storageClass with VM
+# name/status, so both lists get the same slim treatment
+_SC_DV_JSONPATH = (
+    '-o=jsonpath={range .items[*]}{.metadata.namespace}{"\\t"}'
+    '{.metadata.ownerReferences[?(@.kind==\'VirtualMachine\')].name}{"\\t"}'
+    '{.spec.storage.storageClassName}{"\\n"}{end}'
+)
+_VM_JSONPATH = ('-o=jsonpath={range .items[*]}{.metadata.name}{"\\t"}'
+                '{.metadata.namespace}{"\\t"}'
+                '{.status.printableStatus}{"\\n"}{end}')
+
+
+def get_datavolumes_slim_sc() -> Optional[List[Dict]]:
+    """All DVs with only the fields the storage-class report reads (or None)"""
+    output = run_oc_raw(['get', 'dv', '--all-namespaces', _SC_DV_JSONPATH])
+    if output is None:
+        return None
 
-def find_dvs_for_vm(vm_name: str, vm_uid: str, namespace: str) -> List[Dict]:
-    """Find all DataVolumes owned by or referenced by a VM"""
     dvs = []
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 3:
+            continue
+        ns, owner_names, sc = fields
+        dvs.append({
+            'metadata': {
+                'namespace': ns,
+                'ownerReferences': [
+                    {'kind': 'VirtualMachine', 'name': name}
+                    for name in owner_names.split()
+                ],
+            },
+            'spec': {'storage': {'storageClassName': sc or None}},
+        })
+    return dvs
+
+
+def get_vms_slim() -> Optional[List[Dict]]:
+    """All VMs with only name/namespace/status (or None)"""
+    output = run_oc_raw(['get', 'vm', '--all-namespaces', _VM_JSONPATH])
+    if output is None:
+        return None
+
+    vms = []
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 3:
+            continue
+        name, ns, status = fields
+        vms.append({
+            'metadata': {'name': name, 'namespace': ns},
+            'status': {'printableStatus': status or 'Unknown'},
+        })
+    return vms
 
-    # Get all DataVolumes in namespace
-    all_dvs = get_datavolumes(namespace)
 
+def _pvcs_for_tree(namespace: str) -> List[Dict]:
+    """PVCs for print_vm_tree: slim projection, full list as fallback"""
+    pvcs = get_pvcs_slim(namespace)
+    return get_all_pvcs(namespace) if pvcs is None else pvcs
+
+
+def _pvs_for_tree() -> List[Dict]:
+    """PVs for print_vm_tree: slim projection, full list as fallback"""
+    pvs = get_pvs_slim()
+    return get_all_pvs() if pvs is None else pvs
+
+
+def build_dv_owner_index(all_dvs: List[Dict]) -> Dict[tuple, List[Dict]]:
+    """Bucket DVs by (namespace, owning VM name) in one ownerReferences pass.
+
+    Callers that resolve DVs for many VMs build this once and hand it to
+    find_dvs_for_vm, turning each per-VM resolution into a dict lookup.
+    """
+    index: Dict[tuple, List[Dict]] = {}
     for dv in all_dvs:
+        dv_namespace = dv['metadata']['namespace']
+        for ref in dv.get('metadata', {}).get('ownerReferences', []):
+            if ref.get('kind') == 'VirtualMachine':
+                index.setdefault((dv_namespace, ref.get('name')), []).append(dv)
+    return index
+
+
+def find_dvs_for_vm(vm_name: str, vm_uid: str, namespace: str,
+                    index: Optional[Dict[tuple, List[Dict]]] = None) -> List[Dict]:
+    """Find all DataVolumes owned by or referenced by a VM.
+
+    With a prebuilt owner index (see build_dv_owner_index) this is a
+    single lookup; standalone callers fall back to one namespace scan.
+    """
+    if index is not None:
+        return index.get((namespace, vm_name), [])
+
+    dvs = []
+    for dv in get_datavolumes(namespace):
         # Check ownerReferences
         owner_refs = dv.get('metadata', {}).get('ownerReferences', [])
         for ref in owner_refs:
@@ -145,35 +803,104 @@ def print_tree_line(text: str, prefix: str = "", last: bool = False):
     print(f"{prefix}{connector} {text}")
 
 
+def _vm_tree_data(vm_name: str, namespace: str) -> Optional[Dict]:
+    """Structured storage tree for a VM, for --output json"""
+    vm = get_vm(vm_name, namespace)
+    if not vm:
+        return None
+    vm_uid = vm['metadata']['uid']
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        dvs_future = executor.submit(find_dvs_for_vm, vm_name, vm_uid, namespace)
+        pvcs_future = executor.submit(_pvcs_for_tree, namespace)
+        pvs_future = executor.submit(_pvs_for_tree)
+        dvs = dvs_future.result()
+        pvc_index = {p['metadata']['name']: p for p in pvcs_future.result()}
+        pv_index = {p['metadata']['name']: p for p in pvs_future.result()}
+
+    tree = {
+        'name': vm_name,
+        'namespace': namespace,
+        'uid': vm_uid,
+        'status': (vm.get('status') or {}).get('printableStatus', 'Unknown'),
+        'datavolumes': [],
+    }
+    for dv in dvs:
+        storage = (dv.get('spec') or {}).get('storage') or {}
+        entry = {
+            'name': dv['metadata']['name'],
+            'phase': (dv.get('status') or {}).get('phase', 'Unknown'),
+            'size': ((storage.get('resources') or {}).get('requests') or {}).get('storage', 'N/A'),
+            'storageClass': storage.get('storageClassName', 'N/A'),
+            'pvc': None,
+            'pv': None,
+        }
+        pvc = pvc_index.get(entry['name'])
+        if pvc:
+            volume_name = (pvc.get('spec') or {}).get('volumeName')
+            entry['pvc'] = {
+                'status': (pvc.get('status') or {}).get('phase', 'Unknown'),
+                'volumeName': volume_name,
+            }
+            pv = pv_index.get(volume_name) if volume_name else None
+            if pv:
+                pv_spec = pv.get('spec') or {}
+                entry['pv'] = {
+                    'name': volume_name,
+                    'size': (pv_spec.get('capacity') or {}).get('storage', 'N/A'),
+                    'reclaimPolicy': pv_spec.get('persistentVolumeReclaimPolicy', 'N/A'),
+                }
+        tree['datavolumes'].append(entry)
+    return tree
+
+
 def print_vm_tree(vm_name: str, namespace: str):
     """Print storage tree for a specific VM"""
-    print("=" * 80)
-    print(f"  {Colors.BOLD}VM Storage Tree: {vm_name}{Colors.ENDC} (namespace: {namespace})")
-    print("=" * 80)
-    print()
+    # Rendered into a buffer and written once: a print() per line
+    # flushes a line-buffered TTY and takes the stdout lock each time
+    out: List[str] = []
+    w = out.append
+
+    def _flush():
+        sys.stdout.write('\n'.join(out) + '\n')
+
+    w("=" * 80)
+    w(f"  {Colors.BOLD}VM Storage Tree: {vm_name}{Colors.ENDC} (namespace: {namespace})")
+    w("=" * 80)
+    w("")
 
     # Get VM
     vm = get_vm(vm_name, namespace)
     if not vm:
-        print(f"{Colors.FAIL}❌ VirtualMachine '{vm_name}' not found in namespace '{namespace}'{Colors.ENDC}")
+        w(f"{Colors.FAIL}❌ VirtualMachine '{vm_name}' not found in namespace '{namespace}'{Colors.ENDC}")
+        _flush()
         return
 
     vm_uid = vm['metadata']['uid']
     status = vm.get('status', {}).get('printableStatus', 'Unknown')
 
-    print(f"{Colors.OKGREEN}VirtualMachine:{Colors.ENDC} {vm_name}")
-    print(f"├─ UID: {vm_uid}")
-    print(f"├─ Status: {status}")
-    print("│")
-
-    # Find DataVolumes
-    dvs = find_dvs_for_vm(vm_name, vm_uid, namespace)
+    w(f"{Colors.OKGREEN}VirtualMachine:{Colors.ENDC} {vm_name}")
+    w(f"├─ UID: {vm_uid}")
+    w(f"├─ Status: {status}")
+    w("│")
+
+    # The DV, PVC, and PV lists have no data dependency, so fan them out on
+    # threads — each worker blocks in subprocess.run, releasing the GIL, so
+    # the three round-trips overlap
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        dvs_future = executor.submit(find_dvs_for_vm, vm_name, vm_uid, namespace)
+        pvcs_future = executor.submit(_pvcs_for_tree, namespace)
+        pvs_future = executor.submit(_pvs_for_tree)
+        dvs = dvs_future.result()
+        pvc_index = {p['metadata']['name']: p for p in pvcs_future.result()}
+        pv_index = {p['metadata']['name']: p for p in pvs_future.result()}
 
     if not dvs:
-        print("└─ (no DataVolumes found)")
+        w("└─ (no DataVolumes found)")
+        _flush()
         return
 
-    print(f"├─ {Colors.OKCYAN}DataVolumes:{Colors.ENDC} ({len(dvs)} found)")
+    w(f"├─ {Colors.OKCYAN}DataVolumes:{Colors.ENDC} ({len(dvs)} found)")
 
     for idx, dv in enumerate(dvs):
         is_last_dv = (idx == len(dvs) - 1)
@@ -185,23 +912,23 @@ def print_vm_tree(vm_name: str, namespace: str):
         dv_sc = dv.get('spec', {}).get('storage', {}).get('storageClassName', 'N/A')
 
         connector = "└─" if is_last_dv else "├─"
-        print(f"│  {connector} DataVolume: {dv_name}")
-        print(f"{dv_prefix}   ├─ Phase: {dv_phase}")
-        print(f"{dv_prefix}   ├─ Size: {dv_size}")
-        print(f"{dv_prefix}   ├─ StorageClass: {dv_sc}")
+        w(f"│  {connector} DataVolume: {dv_name}")
+        w(f"{dv_prefix}   ├─ Phase: {dv_phase}")
+        w(f"{dv_prefix}   ├─ Size: {dv_size}")
+        w(f"{dv_prefix}   ├─ StorageClass: {dv_sc}")
 
         # Find PVC
-        pvc = get_pvc(dv_name, namespace)
+        pvc = pvc_index.get(dv_name)
         if pvc:
             pvc_status = pvc.get('status', {}).get('phase', 'Unknown')
             pvc_volume_name = pvc.get('spec', {}).get('volumeName')
 
-            print(f"{dv_prefix}   │")
-            print(f"{dv_prefix}   └─ {Colors.OKBLUE}PersistentVolumeClaim:{Colors.ENDC} {dv_name}")
-            print(f"{dv_prefix}      ├─ Status: {pvc_status}")
+            w(f"{dv_prefix}   │")
+            w(f"{dv_prefix}   └─ {Colors.OKBLUE}PersistentVolumeClaim:{Colors.ENDC} {dv_name}")
+            w(f"{dv_prefix}      ├─ Status: {pvc_status}")
 
             if pvc_volume_name:
-                pv = get_pv(pvc_volume_name)
+                pv = pv_index.get(pvc_volume_name)
                 if pv:
                     pv_size = pv.get('spec', {}).get('capacity', {}).get('storage', 'N/A')
                     pv_reclaim = pv.get('spec', {}).get('persistentVolumeReclaimPolicy', 'N/A')
@@ -210,20 +937,21 @@ def print_vm_tree(vm_name: str, namespace: str):
                     if pv_reclaim == "Delete":
                         reclaim_warning = f" {Colors.WARNING}⚠️  (Data will be deleted with PVC!){Colors.ENDC}"
 
-                    print(f"{dv_prefix}      │")
-                    print(f"{dv_prefix}      └─ {Colors.HEADER}PersistentVolume:{Colors.ENDC} {pvc_volume_name}")
-                    print(f"{dv_prefix}         ├─ Size: {pv_size}")
-                    print(f"{dv_prefix}         └─ ReclaimPolicy: {pv_reclaim}{reclaim_warning}")
+                    w(f"{dv_prefix}      │")
+                    w(f"{dv_prefix}      └─ {Colors.HEADER}PersistentVolume:{Colors.ENDC} {pvc_volume_name}")
+                    w(f"{dv_prefix}         ├─ Size: {pv_size}")
+                    w(f"{dv_prefix}         └─ ReclaimPolicy: {pv_reclaim}{reclaim_warning}")
             else:
-                print(f"{dv_prefix}      └─ PersistentVolume: (not yet bound)")
+                w(f"{dv_prefix}      └─ PersistentVolume: (not yet bound)")
         else:
-            print(f"{dv_prefix}   └─ PersistentVolumeClaim: (not found)")
+            w(f"{dv_prefix}   └─ PersistentVolumeClaim: (not found)")
 
         if not is_last_dv:
-            print("│")
+            w("│")
 
-    print()
-    print("=" * 80)
+    w("")
+    w("=" * 80)
+    _flush()
 
 
 def get_active_dvs_for_vm(vm: Dict) -> List[str]:
@@ -231,26 +959,133 @@ def get_active_dvs_for_vm(vm: Dict) -> List[str]:
     Get list of DataVolume names that are actively referenced in VM spec.
     These are the DVs the VM is actually using.
     """
-    active_dvs = []
+    # Insertion-ordered dict as a set: O(1) dedup while keeping the
+    # template-then-volume ordering callers display
+    active_dvs: Dict[str, None] = {}
 
     # Check dataVolumeTemplates
     dv_templates = vm.get('spec', {}).get('dataVolumeTemplates', [])
     for template in dv_templates:
         dv_name = template.get('metadata', {}).get('name')
         if dv_name:
-            active_dvs.append(dv_name)
+            active_dvs[dv_name] = None
 
     # Check volumes in template spec
     volumes = vm.get('spec', {}).get('template', {}).get('spec', {}).get('volumes', [])
     for volume in volumes:
         dv_ref = volume.get('dataVolume', {}).get('name')
-        if dv_ref and dv_ref not in active_dvs:
-            active_dvs.append(dv_ref)
-
-    return active_dvs
-
-
-def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List[Dict]]:
+        if dv_ref:
+            active_dvs[dv_ref] = None
+
+    return list(active_dvs)
+
+
+# Orphan records are tuples rather than dicts: on large clusters they are
+# allocated by the tens of thousands, and a tuple is smaller and cheaper
+# to build than a dict with string keys.
+class OrphanDV(NamedTuple):
+    name: str
+    namespace: str
+    size: str
+    storageClass: str
+    phase: str
+    created: str
+    labels: Dict
+    annotations: Dict
+    correlation: Optional[Dict] = None
+
+
+class OrphanPVC(NamedTuple):
+    name: str
+    namespace: str
+    size: str
+    storageClass: str
+    status: str
+    volumeName: str
+    created: str
+
+
+class OrphanPV(NamedTuple):
+    name: str
+    size: str
+    storageClass: str
+    reclaimPolicy: str
+    status: str
+    claimRef: str
+    created: str
+
+
+def _owner_kinds(obj: Dict) -> frozenset:
+    """Set of ownerReference kinds for a resource, computed once per item"""
+    refs = obj.get('metadata', {}).get('ownerReferences', [])
+    return frozenset(ref.get('kind') for ref in refs)
+
+
+def _scan_orphaned_pvcs(namespace: Optional[str] = None) -> List[Dict]:
+    """Find PVCs not owned by any DataVolume, filtering from the stream
+    so only orphans are retained"""
+    orphans = []
+    for pvc in iter_resource('pvc', namespace):
+        if 'DataVolume' in _owner_kinds(pvc):
+            continue
+        meta = pvc['metadata']
+        spec = pvc.get('spec') or {}
+        orphans.append(OrphanPVC(
+            name=meta['name'],
+            namespace=meta['namespace'],
+            size=((spec.get('resources') or {}).get('requests') or {}).get('storage', 'N/A'),
+            storageClass=spec.get('storageClassName', 'N/A'),
+            status=(pvc.get('status') or {}).get('phase', 'Unknown'),
+            volumeName=spec.get('volumeName', 'N/A'),
+            created=meta.get('creationTimestamp', 'Unknown')
+        ))
+    return orphans
+
+
+def _pvs_by_phase(phase: str) -> Optional[List[Dict]]:
+    """List PVs filtered server-side by status.phase, or None if the
+    server rejects the field selector"""
+    result = run_oc(['get', 'pv', '--field-selector', f'status.phase={phase}',
+                     f'--chunk-size={_LIST_CHUNK_SIZE}'])
+    return result.get('items', []) if result else None
+
+
+def _scan_orphaned_pvs() -> List[Dict]:
+    """Find PVs in Released or Failed state.
+
+    The phase predicate is pushed to the API server via field selectors
+    (one call per phase — field selectors can't express OR), so only the
+    orphan candidates come over the wire. Falls back to streaming the full
+    PV list with a client-side filter if the selector is rejected.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        released_future = executor.submit(_pvs_by_phase, 'Released')
+        failed_future = executor.submit(_pvs_by_phase, 'Failed')
+        released = released_future.result()
+        failed = failed_future.result()
+
+    if released is None or failed is None:
+        candidates = (pv for pv in iter_resource('pv', namespaced=False)
+                      if pv.get('status', {}).get('phase') in ('Released', 'Failed'))
+    else:
+        candidates = released + failed
+
+    orphans = []
+    for pv in candidates:
+        spec = pv.get('spec') or {}
+        orphans.append(OrphanPV(
+            name=pv['metadata']['name'],
+            size=spec.get('capacity', {}).get('storage', 'N/A'),
+            storageClass=spec.get('storageClassName', 'N/A'),
+            reclaimPolicy=spec.get('persistentVolumeReclaimPolicy', 'N/A'),
+            status=pv.get('status', {}).get('phase', 'Unknown'),
+            claimRef=spec.get('claimRef', {}).get('name', 'None'),
+            created=pv['metadata'].get('creationTimestamp', 'Unknown')
+        ))
+    return orphans
+
+
+def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List]:
     """
     Find orphaned storage resources.
 
@@ -265,8 +1100,20 @@ def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List[D
         'pvs': []
     }
 
-    # Get all VMs and build active DV mapping
-    all_vms = get_all_vms(namespace)
+    # The four cluster queries are independent, so they run on threads and
+    # their round-trips overlap; the PVC/PV workers also do their filtering
+    # while this thread correlates VMs and DVs
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        vms_future = executor.submit(get_all_vms, namespace)
+        dvs_future = executor.submit(get_all_datavolumes, namespace)
+        orphan_pvcs_future = executor.submit(_scan_orphaned_pvcs, namespace)
+        orphan_pvs_future = executor.submit(_scan_orphaned_pvs)
+        all_vms = vms_future.result()
+        all_dvs = dvs_future.result()
+        orphaned['pvcs'] = orphan_pvcs_future.result()
+        orphaned['pvs'] = orphan_pvs_future.result()
+
+    # Build active DV mapping from the VMs
     vm_to_active_dvs = {}  # vm_uid -> list of active DV names
     active_dv_set = set()  # (namespace, dv_name)
 
@@ -279,19 +1126,38 @@ def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List[D
         for dv_name in active_dvs:
             active_dv_set.add((vm_namespace, dv_name))
 
-    # Find orphaned DataVolumes
-    all_dvs = get_all_datavolumes(namespace)
+    # Hash indexes so the correlation pass below is O(1) per lookup
+    # instead of rescanning all_vms / all_dvs inside the DV loop
+    vm_by_uid = {vm['metadata']['uid']: vm for vm in all_vms}
+
+    # (namespace, source PVC name) -> names of DVs cloned from it, built
+    # once so migration-source detection below is a single lookup
+    source_pvc_index: Dict[tuple, List[str]] = {}
+    for d in all_dvs:
+        src = (((d.get('spec') or {}).get('source') or {}).get('pvc') or {}).get('name')
+        if src:
+            source_pvc_index.setdefault(
+                (d['metadata']['namespace'], src), []).append(d['metadata']['name'])
+
+    # Find orphaned DataVolumes. The owner-kind set is computed once per
+    # item so DVs owned by something other than a VM are skipped before
+    # any correlation work.
     for dv in all_dvs:
-        dv_name = dv['metadata']['name']
-        dv_namespace = dv['metadata']['namespace']
-        owner_refs = dv.get('metadata', {}).get('ownerReferences', [])
+        meta = dv['metadata']
+        owner_refs = meta.get('ownerReferences', [])
+        owner_kinds = frozenset(ref.get('kind') for ref in owner_refs)
+        if owner_refs and 'VirtualMachine' not in owner_kinds:
+            continue
+
+        dv_name = meta['name']
+        dv_namespace = meta['namespace']
 
-        # Check if owned by a VM
         vm_owner = None
-        for ref in owner_refs:
-            if ref.get('kind') == 'VirtualMachine':
-                vm_owner = ref
-                break
+        if 'VirtualMachine' in owner_kinds:
+            for ref in owner_refs:
+                if ref.get('kind') == 'VirtualMachine':
+                    vm_owner = ref
+                    break
 
         is_orphaned = False
         correlation = None
@@ -307,32 +1173,18 @@ def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List[D
                 vm_uid = vm_owner.get('uid')
 
                 # Find the VM object
-                vm_obj = None
-                for vm in all_vms:
-                    if vm['metadata']['uid'] == vm_uid:
-                        vm_obj = vm
-                        break
+                vm_obj = vm_by_uid.get(vm_uid)
 
                 if vm_obj:
                     vm_status = vm_obj.get('status', {}).get('printableStatus', 'Unknown')
                     current_dvs = vm_to_active_dvs.get(vm_uid, [])
 
                     # Check if this orphaned DV is the source for any active DV
-                    is_source_for = []
-                    for active_dv_name in current_dvs:
-                        # Get the active DV
-                        active_dv = None
-                        for dv_candidate in all_dvs:
-                            if (dv_candidate['metadata']['name'] == active_dv_name and
-                                dv_candidate['metadata']['namespace'] == dv_namespace):
-                                active_dv = dv_candidate
-                                break
-
-                        if active_dv:
-                            # Check if orphaned DV is the source
-                            source_pvc = active_dv.get('spec', {}).get('source', {}).get('pvc', {})
-                            if source_pvc.get('name') == dv_name:
-                                is_source_for.append(active_dv_name)
+                    current_dv_set = set(current_dvs)
+                    is_source_for = [
+                        clone for clone in source_pvc_index.get((dv_namespace, dv_name), [])
+                        if clone in current_dv_set
+                    ]
 
                     # Build correlation
                     correlation = {
@@ -358,71 +1210,129 @@ def find_orphaned_resources(namespace: Optional[str] = None) -> Dict[str, List[D
             is_orphaned = True
 
         if is_orphaned:
-            dv_info = {
-                'name': dv_name,
-                'namespace': dv_namespace,
-                'size': dv.get('spec', {}).get('storage', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A'),
-                'storageClass': dv.get('spec', {}).get('storage', {}).get('storageClassName', 'N/A'),
-                'phase': dv.get('status', {}).get('phase', 'Unknown'),
-                'created': dv['metadata'].get('creationTimestamp', 'Unknown'),
-                'labels': dv.get('metadata', {}).get('labels', {}),
-                'annotations': dv.get('metadata', {}).get('annotations', {})
-            }
-
-            if correlation:
-                dv_info['correlation'] = correlation
-
-            orphaned['datavolumes'].append(dv_info)
-
-    # Find orphaned PVCs (no ownerReferences or not owned by DataVolume)
-    all_pvcs = get_all_pvcs(namespace)
-    for pvc in all_pvcs:
-        owner_refs = pvc.get('metadata', {}).get('ownerReferences', [])
-
-        # Check if owned by a DataVolume
-        has_dv_owner = any(ref.get('kind') == 'DataVolume' for ref in owner_refs)
-
-        if not has_dv_owner:
-            orphaned['pvcs'].append({
-                'name': pvc['metadata']['name'],
-                'namespace': pvc['metadata']['namespace'],
-                'size': pvc.get('spec', {}).get('resources', {}).get('requests', {}).get('storage', 'N/A'),
-                'storageClass': pvc.get('spec', {}).get('storageClassName', 'N/A'),
-                'status': pvc.get('status', {}).get('phase', 'Unknown'),
-                'volumeName': pvc.get('spec', {}).get('volumeName', 'N/A'),
-                'created': pvc['metadata'].get('creationTimestamp', 'Unknown')
-            })
-
-    # Find orphaned PVs (Released or Failed state)
-    all_pvs = get_all_pvs()
-    for pv in all_pvs:
-        phase = pv.get('status', {}).get('phase', 'Unknown')
-
-        # PVs in Released or Failed state are orphaned
-        if phase in ['Released', 'Failed']:
-            orphaned['pvs'].append({
-                'name': pv['metadata']['name'],
-                'size': pv.get('spec', {}).get('capacity', {}).get('storage', 'N/A'),
-                'storageClass': pv.get('spec', {}).get('storageClassName', 'N/A'),
-                'reclaimPolicy': pv.get('spec', {}).get('persistentVolumeReclaimPolicy', 'N/A'),
-                'status': phase,
-                'claimRef': pv.get('spec', {}).get('claimRef', {}).get('name', 'None'),
-                'created': pv['metadata'].get('creationTimestamp', 'Unknown')
-            })
+            # 'or {}' rather than .get defaults: survives fields that are
+            # explicitly null, and each level is bound once instead of
+            # re-walking the chain per field
+            storage = (dv.get('spec') or {}).get('storage') or {}
+            requests = (storage.get('resources') or {}).get('requests') or {}
+            orphaned['datavolumes'].append(OrphanDV(
+                name=dv_name,
+                namespace=dv_namespace,
+                size=requests.get('storage', 'N/A'),
+                storageClass=storage.get('storageClassName', 'N/A'),
+                phase=(dv.get('status') or {}).get('phase', 'Unknown'),
+                created=meta.get('creationTimestamp', 'Unknown'),
+                labels=meta.get('labels', {}),
+                annotations=meta.get('annotations', {}),
+                correlation=correlation
+            ))
 
     return orphaned
 
 
+# Templates for the DV renderers, built on first use so they pick up the
+# final color settings (--no-color is processed in main before printing)
+_DV_TMPLS: Dict[str, str] = {}
+
+
+def _dv_tmpls() -> Dict[str, str]:
+    if not _DV_TMPLS:
+        _DV_TMPLS['head'] = (
+            f"  • {Colors.OKCYAN}DataVolume:{Colors.ENDC} {{name}}\n"
+            "    ├─ Namespace: {namespace}\n"
+            "    ├─ Size: {size}\n"
+            "    ├─ StorageClass: {storageClass}\n"
+            "    ├─ Phase: {phase}"
+        )
+        _DV_TMPLS['migration'] = (
+            f"    ├─ {Colors.WARNING}Migration DV:{Colors.ENDC} "
+            "{source_sc} → {target_sc}\n"
+            "    │  └─ Migrated at: {migration_ts}"
+        )
+    return _DV_TMPLS
+
+
+def _render_dv_head(dv: OrphanDV, w):
+    """Emit the lines every orphaned DV gets: identity plus migration labels"""
+    tmpls = _dv_tmpls()
+    w(tmpls['head'].format_map(dv._asdict()))
+    if dv.labels.get('storage-migration') == 'true':
+        w(tmpls['migration'].format(
+            source_sc=dv.labels.get('source-sc', 'N/A'),
+            target_sc=dv.labels.get('target-sc', 'N/A'),
+            migration_ts=dv.annotations.get('migration-timestamp', 'N/A')))
+
+
+def _render_uncorrelated_dv(dv: OrphanDV, w):
+    """Fast path for the common deleted-VM case — no correlation block"""
+    _render_dv_head(dv, w)
+    w(f"    └─ Created: {dv.created}")
+
+
+def _render_correlated_dv(dv: OrphanDV, w):
+    """Full renderer for DVs correlated back to an owning VM"""
+    _render_dv_head(dv, w)
+    corr = dv.correlation
+    confidence = corr['confidence']
+
+    # Color code by confidence
+    if confidence == 'very-high':
+        conf_color = Colors.OKGREEN
+        conf_symbol = "✓✓"
+    elif confidence == 'high':
+        conf_color = Colors.OKGREEN
+        conf_symbol = "✓"
+    elif confidence == 'medium':
+        conf_color = Colors.WARNING
+        conf_symbol = "~"
+    else:
+        conf_color = Colors.WARNING
+        conf_symbol = "?"
+
+    w(f"    ├─ {conf_color}Belongs to VM:{Colors.ENDC} {corr['vm_name']} ({conf_symbol} {confidence} confidence)")
+    w(f"    │  ├─ Reason: {corr['reason']}")
+    w(f"    │  ├─ VM Status: {corr['vm_status']}")
+
+    if corr.get('replaced_by'):
+        w(f"    │  ├─ {Colors.OKCYAN}Replaced by:{Colors.ENDC} {', '.join(corr['replaced_by'])}")
+
+    if corr['current_vm_dvs']:
+        w(f"    │  └─ VM's current DVs: {', '.join(corr['current_vm_dvs'])}")
+
+    # Provide use case hint
+    if confidence == 'very-high' and corr.get('is_migration'):
+        w(f"    │")
+        w(f"    │  {Colors.WARNING}💡 Hint:{Colors.ENDC} This is an old disk from a storage migration.")
+        w(f"    │      • The VM is now using the migrated disk(s)")
+        w(f"    │      • If VM is working correctly, this can be safely deleted")
+        w(f"    │      • If kept as backup, consider adding a 'backup' label for tracking")
+    elif confidence == 'high':
+        w(f"    │")
+        w(f"    │  {Colors.WARNING}💡 Hint:{Colors.ENDC} This disk has ownerReference but VM doesn't use it.")
+        w(f"    │      • Verify the VM is working with its current disks")
+        w(f"    │      • This is likely leftover from a manual operation or migration")
+        w(f"    │      • Safe to delete if VM is functioning properly")
+
+    w(f"    └─ Created: {dv.created}")
+
+
 def print_orphaned_resources(namespace: Optional[str] = None):
     """Print orphaned storage resources"""
-    print("=" * 80)
-    print(f"  {Colors.BOLD}Orphaned Storage Resources{Colors.ENDC}")
+    # Buffered like print_vm_tree — one stdout write for the whole report
+    out: List[str] = []
+    w = out.append
+
+    def _flush():
+        sys.stdout.write('\n'.join(out) + '\n')
+
+    w("=" * 80)
+    w(f"  {Colors.BOLD}Orphaned Storage Resources{Colors.ENDC}")
     if namespace:
-        print(f"  {Colors.BOLD}Namespace: {namespace}{Colors.ENDC}")
+        w(f"  {Colors.BOLD}Namespace: {namespace}{Colors.ENDC}")
     else:
-        print(f"  {Colors.BOLD}All Namespaces{Colors.ENDC}")
-    print("=" * 80)
-    print()
+        w(f"  {Colors.BOLD}All Namespaces{Colors.ENDC}")
+    w("=" * 80)
+    w("")
 
     orphaned = find_orphaned_resources(namespace)
 
@@ -430,150 +1340,106 @@ def print_orphaned_resources(namespace: Optional[str] = None):
     total_orphans = len(orphaned['datavolumes']) + len(orphaned['pvcs']) + len(orphaned['pvs'])
 
     if total_orphans == 0:
-        print(f"{Colors.OKGREEN}✅ No orphaned resources found!{Colors.ENDC}")
-        print()
-        print("=" * 80)
+        w(f"{Colors.OKGREEN}✅ No orphaned resources found!{Colors.ENDC}")
+        w("")
+        w("=" * 80)
+        _flush()
         return
 
-    print(f"{Colors.WARNING}Found {total_orphans} orphaned resource(s):{Colors.ENDC}\n")
+    w(f"{Colors.WARNING}Found {total_orphans} orphaned resource(s):{Colors.ENDC}\n")
 
     # Print orphaned DataVolumes
     if orphaned['datavolumes']:
-        print(f"{Colors.FAIL}❌ Orphaned DataVolumes: {len(orphaned['datavolumes'])}{Colors.ENDC}")
-        print(f"{Colors.WARNING}(Not owned by any VirtualMachine){Colors.ENDC}\n")
+        w(f"{Colors.FAIL}❌ Orphaned DataVolumes: {len(orphaned['datavolumes'])}{Colors.ENDC}")
+        w(f"{Colors.WARNING}(Not owned by any VirtualMachine){Colors.ENDC}\n")
 
         for dv in orphaned['datavolumes']:
-            print(f"  • {Colors.OKCYAN}DataVolume:{Colors.ENDC} {dv['name']}")
-            print(f"    ├─ Namespace: {dv['namespace']}")
-            print(f"    ├─ Size: {dv['size']}")
-            print(f"    ├─ StorageClass: {dv['storageClass']}")
-            print(f"    ├─ Phase: {dv['phase']}")
-
-            # Show migration info if present
-            is_migration = dv['labels'].get('storage-migration') == 'true'
-            if is_migration:
-                source_sc = dv['labels'].get('source-sc', 'N/A')
-                target_sc = dv['labels'].get('target-sc', 'N/A')
-                migration_ts = dv['annotations'].get('migration-timestamp', 'N/A')
-                print(f"    ├─ {Colors.WARNING}Migration DV:{Colors.ENDC} {source_sc} → {target_sc}")
-                print(f"    │  └─ Migrated at: {migration_ts}")
-
-            # Show correlation if found
-            if 'correlation' in dv:
-                corr = dv['correlation']
-                confidence = corr['confidence']
-
-                # Color code by confidence
-                if confidence == 'very-high':
-                    conf_color = Colors.OKGREEN
-                    conf_symbol = "✓✓"
-                elif confidence == 'high':
-                    conf_color = Colors.OKGREEN
-                    conf_symbol = "✓"
-                elif confidence == 'medium':
-                    conf_color = Colors.WARNING
-                    conf_symbol = "~"
-                else:
-                    conf_color = Colors.WARNING
-                    conf_symbol = "?"
-
-                print(f"    ├─ {conf_color}Belongs to VM:{Colors.ENDC} {corr['vm_name']} ({conf_symbol} {confidence} confidence)")
-                print(f"    │  ├─ Reason: {corr['reason']}")
-                print(f"    │  ├─ VM Status: {corr['vm_status']}")
-
-                if corr.get('replaced_by'):
-                    print(f"    │  ├─ {Colors.OKCYAN}Replaced by:{Colors.ENDC} {', '.join(corr['replaced_by'])}")
-
-                if corr['current_vm_dvs']:
-                    print(f"    │  └─ VM's current DVs: {', '.join(corr['current_vm_dvs'])}")
-
-                # Provide use case hint
-                if confidence == 'very-high' and corr.get('is_migration'):
-                    print(f"    │")
-                    print(f"    │  {Colors.WARNING}💡 Hint:{Colors.ENDC} This is an old disk from a storage migration.")
-                    print(f"    │      • The VM is now using the migrated disk(s)")
-                    print(f"    │      • If VM is working correctly, this can be safely deleted")
-                    print(f"    │      • If kept as backup, consider adding a 'backup' label for tracking")
-                elif confidence == 'high':
-                    print(f"    │")
-                    print(f"    │  {Colors.WARNING}💡 Hint:{Colors.ENDC} This disk has ownerReference but VM doesn't use it.")
-                    print(f"    │      • Verify the VM is working with its current disks")
-                    print(f"    │      • This is likely leftover from a manual operation or migration")
-                    print(f"    │      • Safe to delete if VM is functioning properly")
-
-            print(f"    └─ Created: {dv['created']}")
-            print()
+            (_render_correlated_dv if dv.correlation
+             else _render_uncorrelated_dv)(dv, w)
+            w("")
 
     # Print orphaned PVCs
     if orphaned['pvcs']:
-        print(f"{Colors.FAIL}❌ Orphaned PVCs: {len(orphaned['pvcs'])}{Colors.ENDC}")
-        print(f"{Colors.WARNING}(Not owned by any DataVolume){Colors.ENDC}\n")
-
+        w(f"{Colors.FAIL}❌ Orphaned PVCs: {len(orphaned['pvcs'])}{Colors.ENDC}")
+        w(f"{Colors.WARNING}(Not owned by any DataVolume){Colors.ENDC}\n")
+
+        pvc_tmpl = (
+            f"  • {Colors.OKBLUE}PersistentVolumeClaim:{Colors.ENDC} {{name}}\n"
+            "    ├─ Namespace: {namespace}\n"
+            "    ├─ Size: {size}\n"
+            "    ├─ StorageClass: {storageClass}\n"
+            "    ├─ Status: {status}\n"
+            "    ├─ Volume: {volumeName}\n"
+            "    └─ Created: {created}\n"
+        )
         for pvc in orphaned['pvcs']:
-            print(f"  • {Colors.OKBLUE}PersistentVolumeClaim:{Colors.ENDC} {pvc['name']}")
-            print(f"    ├─ Namespace: {pvc['namespace']}")
-            print(f"    ├─ Size: {pvc['size']}")
-            print(f"    ├─ StorageClass: {pvc['storageClass']}")
-            print(f"    ├─ Status: {pvc['status']}")
-            print(f"    ├─ Volume: {pvc['volumeName']}")
-            print(f"    └─ Created: {pvc['created']}")
-            print()
+            w(pvc_tmpl.format_map(pvc._asdict()))
 
     # Print orphaned PVs
     if orphaned['pvs']:
-        print(f"{Colors.FAIL}❌ Orphaned PVs: {len(orphaned['pvs'])}{Colors.ENDC}")
-        print(f"{Colors.WARNING}(Released or Failed state){Colors.ENDC}\n")
-
+        w(f"{Colors.FAIL}❌ Orphaned PVs: {len(orphaned['pvs'])}{Colors.ENDC}")
+        w(f"{Colors.WARNING}(Released or Failed state){Colors.ENDC}\n")
+
+        pv_tmpl = (
+            f"  • {Colors.HEADER}PersistentVolume:{Colors.ENDC} {{name}}\n"
+            "    ├─ Size: {size}\n"
+            "    ├─ StorageClass: {storageClass}\n"
+            "    ├─ ReclaimPolicy: {reclaimPolicy}\n"
+            "    ├─ Status: {status}\n"
+            "    ├─ ClaimRef: {claimRef}\n"
+            "    └─ Created: {created}\n"
+        )
         for pv in orphaned['pvs']:
-            print(f"  • {Colors.HEADER}PersistentVolume:{Colors.ENDC} {pv['name']}")
-            print(f"    ├─ Size: {pv['size']}")
-            print(f"    ├─ StorageClass: {pv['storageClass']}")
-            print(f"    ├─ ReclaimPolicy: {pv['reclaimPolicy']}")
-            print(f"    ├─ Status: {pv['status']}")
-            print(f"    ├─ ClaimRef: {pv['claimRef']}")
-            print(f"    └─ Created: {pv['created']}")
-            print()
+            w(pv_tmpl.format_map(pv._asdict()))
 
-    print("=" * 80)
-    print(f"{Colors.BOLD}Cleanup Recommendations:{Colors.ENDC}\n")
+    w("=" * 80)
+    w(f"{Colors.BOLD}Cleanup Recommendations:{Colors.ENDC}\n")
 
     # Count correlated orphans
-    correlated_dvs = [dv for dv in orphaned['datavolumes'] if 'correlation' in dv]
-    uncorrelated_dvs = [dv for dv in orphaned['datavolumes'] if 'correlation' not in dv]
+    correlated_dvs = [dv for dv in orphaned['datavolumes'] if dv.correlation]
+    uncorrelated_dvs = [dv for dv in orphaned['datavolumes'] if not dv.correlation]
 
     if correlated_dvs:
-        migration_dvs = [dv for dv in correlated_dvs if dv['correlation'].get('is_migration')]
-        other_correlated = [dv for dv in correlated_dvs if not dv['correlation'].get('is_migration')]
+        migration_dvs = [dv for dv in correlated_dvs if dv.correlation.get('is_migration')]
+        other_correlated = [dv for dv in correlated_dvs if not dv.correlation.get('is_migration')]
 
         if migration_dvs:
-            print(f"{Colors.OKGREEN}✓ {len(migration_dvs)} orphaned DV(s) from storage migrations{Colors.ENDC}")
-            print(f"  → These were replaced by new DataVolumes on different storage classes")
-            print(f"  → Verify VMs are working with new disks, then delete old ones\n")
+            w(f"{Colors.OKGREEN}✓ {len(migration_dvs)} orphaned DV(s) from storage migrations{Colors.ENDC}")
+            w(f"  → These were replaced by new DataVolumes on different storage classes")
+            w(f"  → Verify VMs are working with new disks, then delete old ones\n")
 
         if other_correlated:
-            print(f"{Colors.WARNING}⚠ {len(other_correlated)} orphaned DV(s) with ownerReferences but not in VM specs{Colors.ENDC}")
-            print(f"  → Likely leftover from manual VM spec changes")
-            print(f"  → Verify VMs are working, then clean up\n")
+            w(f"{Colors.WARNING}⚠ {len(other_correlated)} orphaned DV(s) with ownerReferences but not in VM specs{Colors.ENDC}")
+            w(f"  → Likely leftover from manual VM spec changes")
+            w(f"  → Verify VMs are working, then clean up\n")
 
     if uncorrelated_dvs:
-        print(f"{Colors.WARNING}⚠ {len(uncorrelated_dvs)} orphaned DV(s) with no VM owner{Colors.ENDC}")
-        print(f"  → May be from deleted VMs, manual creations, or failed operations")
-        print(f"  → Review carefully before deletion\n")
-
-    print(f"{Colors.WARNING}⚠️  All orphaned resources are consuming storage but not actively used{Colors.ENDC}")
-    print(f"{Colors.WARNING}⚠️  Consider cleaning up to reclaim storage space{Colors.ENDC}")
-    print("=" * 80)
-
-
-def print_storage_class_usage(storage_class: str):
-    """Print all VMs using a specific storage class"""
-    print("=" * 80)
-    print(f"  {Colors.BOLD}VMs using StorageClass: {storage_class}{Colors.ENDC}")
-    print("=" * 80)
-    print()
-
-    # Get all VMs
-    vms = get_all_vms()
+        w(f"{Colors.WARNING}⚠ {len(uncorrelated_dvs)} orphaned DV(s) with no VM owner{Colors.ENDC}")
+        w(f"  → May be from deleted VMs, manual creations, or failed operations")
+        w(f"  → Review carefully before deletion\n")
+
+    w(f"{Colors.WARNING}⚠️  All orphaned resources are consuming storage but not actively used{Colors.ENDC}")
+    w(f"{Colors.WARNING}⚠️  Consider cleaning up to reclaim storage space{Colors.ENDC}")
+    w("=" * 80)
+    _flush()
+
+
+def _storage_class_usage(storage_class: str) -> List[Dict]:
+    """VMs with at least one DV on the storage class, as report records"""
+    # List DVs and VMs once (concurrently) and bucket DVs by owning VM, so
+    # the per-VM work below is a dict lookup instead of a namespace re-list
+    # and ownerReferences scan per VM
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        dvs_future = executor.submit(get_datavolumes_slim_sc)
+        vms_future = executor.submit(get_vms_slim)
+        all_dvs = dvs_future.result()
+        vms = vms_future.result()
+    if all_dvs is None:
+        all_dvs = get_all_datavolumes()
+    if vms is None:
+        vms = get_all_vms()
+
+    dvs_by_vm = build_dv_owner_index(all_dvs)
 
     matching_vms = []
 
@@ -581,9 +1447,7 @@ def print_storage_class_usage(storage_class: str):
         vm_name = vm['metadata']['name']
         vm_namespace = vm['metadata']['namespace']
 
-        # Find DataVolumes for this VM
-        vm_uid = vm['metadata']['uid']
-        dvs = find_dvs_for_vm(vm_name, vm_uid, vm_namespace)
+        dvs = dvs_by_vm.get((vm_namespace, vm_name), [])
 
         # Check if any DV uses the storage class
         for dv in dvs:
@@ -597,6 +1461,18 @@ def print_storage_class_usage(storage_class: str):
                 })
                 break
 
+    return matching_vms
+
+
+def print_storage_class_usage(storage_class: str):
+    """Print all VMs using a specific storage class"""
+    print("=" * 80)
+    print(f"  {Colors.BOLD}VMs using StorageClass: {storage_class}{Colors.ENDC}")
+    print("=" * 80)
+    print()
+
+    matching_vms = _storage_class_usage(storage_class)
+
     if not matching_vms:
         print(f"{Colors.WARNING}No VMs found using StorageClass '{storage_class}'{Colors.ENDC}")
         return
@@ -641,29 +1517,50 @@ Examples:
     parser.add_argument('--find-orphans', action='store_true', help='Find orphaned storage resources (DataVolumes, PVCs, PVs not owned by VMs)')
     parser.add_argument('-A', '--all-namespaces', action='store_true', help='Search across all namespaces (for --find-orphans)')
     parser.add_argument('--no-color', action='store_true', help='Disable colored output')
+    parser.add_argument('--cache-ttl', type=int, default=0, metavar='SECONDS',
+                        help='Reuse list responses cached on disk for this many seconds (default: 0, disabled)')
+    parser.add_argument('-o', '--output', choices=['text', 'json'], default='text',
+                        help='Output format: human-readable tree or machine-readable JSON (default: text)')
 
     args = parser.parse_args()
 
+    if args.cache_ttl:
+        global _CACHE_TTL
+        _CACHE_TTL = args.cache_ttl
+
     # Disable colors if requested
     if args.no_color:
-        for attr in dir(Colors):
-            if not attr.startswith('_'):
-                setattr(Colors, attr, '')
+        _disable_colors()
 
-    # Check if oc or kubectl is available
-    cmd_available = False
-    for cmd in ['oc', 'kubectl']:
-        try:
-            subprocess.run([cmd, 'version'], capture_output=True, check=True)
-            cmd_available = True
-            break
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
-
-    if not cmd_available:
+    # Check if oc or kubectl is on PATH (resolved once; run_oc reuses it).
+    # No 'version' probe: that costs an extra subprocess plus an apiserver
+    # round trip, and any auth problem surfaces from the first real call.
+    if not _oc_bin():
         print(f"{Colors.FAIL}Error: Neither 'oc' nor 'kubectl' command found. Please install one.{Colors.ENDC}")
         sys.exit(1)
 
+    # Machine-readable mode: emit structured data and skip all rendering
+    if args.output == 'json':
+        if args.find_orphans:
+            namespace = None if args.all_namespaces else args.namespace
+            orphaned = find_orphaned_resources(namespace)
+            payload = {kind: [record._asdict() for record in records]
+                       for kind, records in orphaned.items()}
+        elif args.storage_class:
+            payload = {'storageClass': args.storage_class,
+                       'vms': _storage_class_usage(args.storage_class)}
+        elif args.vm_name:
+            payload = _vm_tree_data(args.vm_name, args.namespace)
+            if payload is None:
+                print(f"VirtualMachine '{args.vm_name}' not found in namespace "
+                      f"'{args.namespace}'", file=sys.stderr)
+                sys.exit(1)
+        else:
+            parser.print_help()
+            sys.exit(1)
+        sys.stdout.buffer.write(_dumps(payload) + b'\n')
+        return
+
     # Mode 1: Find orphaned resources
     if args.find_orphans:
         namespace = None if args.all_namespaces else args.namespace